@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+bench_adr_cycles.py - Scaling benchmark for validate_adrs.py cycle detection.
+
+Generates `supersedes` graphs in memory and times the cycle engine used by
+validate_corpus() (strongly connected components plus one example cycle
+per component) at a quarter, half and all of --nodes. Linear scaling shows
+up as a flat microseconds-per-edge column.
+
+Graph shapes:
+  chain   - each ADR supersedes the previous one: one path --nodes long,
+            the case that overflowed the old recursive DFS.
+  ring    - the chain closed into a single cycle through every ADR.
+  random  - sparse random edges (--degree per ADR) with planted 2-5 node
+            cycles, the shape of a real decision log.
+
+Usage:
+  py -3 plugins/doc-master/scripts/bench_adr_cycles.py                  # 100k nodes, all shapes
+  py -3 plugins/doc-master/scripts/bench_adr_cycles.py --nodes 500000
+  py -3 plugins/doc-master/scripts/bench_adr_cycles.py --shape chain --corpus
+  py -3 plugins/doc-master/scripts/bench_adr_cycles.py --format json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+import validate_adrs as va  # noqa: E402
+
+SHAPES = ("chain", "ring", "random")
+
+
+def node_id(n: int) -> str:
+    return f"{n:06d}"
+
+
+def generate(shape: str, nodes: int, degree: float = 1.5,
+             seed: int = 1) -> dict[str, set[str]]:
+    """Build a supersedes edge map (id -> superseded ids) of the given shape."""
+    edges: dict[str, set[str]] = {}
+    if shape in ("chain", "ring"):
+        for n in range(2, nodes + 1):
+            edges[node_id(n)] = {node_id(n - 1)}
+        if shape == "ring":
+            edges[node_id(1)] = {node_id(nodes)}
+        return edges
+    rng = random.Random(seed)
+    # Mostly newer-supersedes-older (acyclic), plus planted small cycles.
+    for n in range(2, nodes + 1):
+        count = int(degree) + (rng.random() < degree - int(degree))
+        edges[node_id(n)] = {node_id(rng.randint(1, n - 1)) for _ in range(count)}
+    for _ in range(max(1, nodes // 1000)):
+        size = rng.randint(2, 5)
+        members = [node_id(rng.randint(1, nodes)) for _ in range(size)]
+        for a, b in zip(members, members[1:] + members[:1]):
+            if a != b:
+                edges.setdefault(a, set()).add(b)
+    return edges
+
+
+def detect(edges: dict[str, set[str]]) -> list[list[str]]:
+    # Same work validate_corpus() does per edge kind.
+    return [va.shortest_cycle(edges, members) for members in va.find_cycles(edges)]
+
+
+def records_for(edges: dict[str, set[str]], nodes: int) -> list[dict[str, Any]]:
+    """Synthetic validate_file() records carrying the same edges."""
+    records = []
+    for n in range(1, nodes + 1):
+        nid = node_id(n)
+        records.append({
+            "path": f"{nid}-decision.md", "rel": f"{nid}-decision.md", "id": nid,
+            "frontmatter": {},
+            "references": {"supersedes": sorted(edges.get(nid, ())), "amends": [],
+                           "relates-to": []},
+        })
+    return records
+
+
+def best_of(repeat: int, func: Any) -> tuple[float, Any]:
+    best = None
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def run(shapes: list[str], nodes: int, degree: float, seed: int, repeat: int,
+        corpus: bool) -> list[dict[str, Any]]:
+    rows = []
+    for shape in shapes:
+        for size in (nodes // 4, nodes // 2, nodes):
+            edges = generate(shape, size, degree, seed)
+            edge_count = sum(len(t) for t in edges.values())
+            seconds, cycles = best_of(repeat, lambda: detect(edges))
+            row = {
+                "shape": shape,
+                "nodes": size,
+                "edges": edge_count,
+                "cycles": len(cycles),
+                "seconds": seconds,
+                "us_per_edge": seconds / max(edge_count, 1) * 1e6,
+            }
+            if corpus:
+                records = records_for(edges, size)
+                row["corpus_seconds"], _ = best_of(repeat, lambda: va.validate_corpus(records))
+            rows.append(row)
+    return rows
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark ADR cycle detection on generated graphs")
+    parser.add_argument("--nodes", type=int, default=100_000,
+                        help="Largest graph size (default: 100000)")
+    parser.add_argument("--shape", choices=SHAPES, action="append",
+                        help="Graph shape; repeat for several (default: all)")
+    parser.add_argument("--degree", type=float, default=1.5,
+                        help="Average supersedes edges per ADR for --shape random (default: 1.5)")
+    parser.add_argument("--seed", type=int, default=1, help="Random seed (default: 1)")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="Timed runs per graph; best is reported (default: 3)")
+    parser.add_argument("--corpus", action="store_true",
+                        help="Also time the full validate_corpus() on matching synthetic records")
+    parser.add_argument("--format", choices=("text", "json"), default="text")
+    args = parser.parse_args()
+    if args.nodes < 8:
+        parser.error("--nodes must be at least 8")
+
+    rows = run(args.shape or list(SHAPES), args.nodes, args.degree, args.seed,
+               args.repeat, args.corpus)
+    if args.format == "json":
+        print(json.dumps({"nodes": args.nodes, "degree": args.degree, "seed": args.seed,
+                          "results": rows}, indent=2))
+        return 0
+
+    print("=== ADR cycle detection benchmark ===")
+    print(f"Python {sys.version.split()[0]}, best of {args.repeat}")
+    print()
+    header = f"{'SHAPE':<8} {'NODES':>9} {'EDGES':>9} {'CYCLES':>7} {'MS':>9} {'US/EDGE':>8}"
+    if args.corpus:
+        header += f" {'CORPUS MS':>10}"
+    print(header)
+    print("-" * len(header))
+    for r in rows:
+        line = (f"{r['shape']:<8} {r['nodes']:>9} {r['edges']:>9} {r['cycles']:>7} "
+                f"{r['seconds'] * 1000:>9.1f} {r['us_per_edge']:>8.2f}")
+        if args.corpus:
+            line += f" {r['corpus_seconds'] * 1000:>10.1f}"
+        print(line)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -44,6 +44,17 @@ clear "unsupported YAML construct" message; the script does not crash.
 
 CLI:
   py -3 validate_adrs.py [--root <path>] [--format text|json] [--strict]
+                         [--jobs N] [--no-cache] [--cache-file <path>]
+                         [--graph-file <path>] [--no-graph]
+  py -3 validate_adrs.py --who-supersedes ID | --chain ID | --orphans
+
+Per-file results are cached by content hash (default
+`<base>/.cache/validate_adrs-<root hash>.json`, one file per ADR root), so
+a re-run only re-parses ADRs whose bytes changed; cross-file checks always
+run over the full record set.
+Each run also updates a persistent relationship graph in the same
+`.cache/` directory (`adr_graph-<root hash>.json`), and the graph queries
+answer from it, parsing only files changed since the index was written.
 
 Exit codes:
   0 - no errors (warnings allowed unless --strict)
@@ -57,6 +68,7 @@ For ADR Explorer parser semantics, see the doc-master skills under
 from __future__ import annotations
 
 import argparse
+import hashlib
 import json
 import os
 import re
@@ -71,6 +83,7 @@ from typing import Any
 VALID_STATUSES = {"proposed", "accepted", "superseded", "deprecated"}
 REQUIRED_KEYS = ("title", "status", "date", "deciders")
 GRAPH_KEYS = ("supersedes", "amends", "relates-to")
+CYCLE_KEYS = ("supersedes", "amends")  # relates-to is symmetric by nature; cycles are fine
 GENERIC_DECIDERS = {"the team", "team", "tbd", "n/a", "na", "unknown", "everyone"}
 
 ROOT_CANDIDATES = (
@@ -107,15 +120,17 @@ RELATIONSHIPS_LINK_PREFIX_RE = re.compile(
 # ---------------------------------------------------------------------------
 
 class Finding:
-    __slots__ = ("level", "code", "message", "file", "line")
+    __slots__ = ("level", "code", "message", "file", "line", "data")
 
     def __init__(self, level: str, code: str, message: str,
-                 file: str | None = None, line: int | None = None) -> None:
+                 file: str | None = None, line: int | None = None,
+                 data: dict[str, Any] | None = None) -> None:
         self.level = level  # "error" | "warn"
         self.code = code
         self.message = message
         self.file = file
         self.line = line
+        self.data = data  # structured detail for JSON output only
 
     def to_dict(self) -> dict[str, Any]:
         d: dict[str, Any] = {"level": self.level, "code": self.code,
@@ -124,8 +139,15 @@ class Finding:
             d["file"] = self.file
         if self.line is not None:
             d["line"] = self.line
+        if self.data is not None:
+            d["data"] = self.data
         return d
 
+    @classmethod
+    def from_dict(cls, d: dict[str, Any]) -> "Finding":
+        return cls(d["level"], d["code"], d["message"], d.get("file"), d.get("line"),
+                   d.get("data"))
+
 
 # ---------------------------------------------------------------------------
 # Minimal YAML frontmatter parser
@@ -408,12 +430,21 @@ def normalize_id(value: Any) -> str | None:
     return digits.zfill(4)
 
 
-def validate_file(path: Path, root: Path) -> tuple[dict[str, Any], list[Finding]]:
-    """Return (parsed_record, findings) for a single ADR file."""
+def relative_name(path: Path, root: Path) -> str:
     try:
-        rel = path.relative_to(root).as_posix()
+        return path.relative_to(root).as_posix()
     except ValueError:
-        rel = path.name
+        return path.name
+
+
+def validate_file(path: Path, root: Path) -> tuple[dict[str, Any], list[Finding]]:
+    """Return (parsed_record, findings) for a single ADR file."""
+    return validate_bytes(path, relative_name(path, root), path.read_bytes())
+
+
+def validate_bytes(path: Path, rel: str,
+                   data: bytes) -> tuple[dict[str, Any], list[Finding]]:
+    """Validate an ADR whose raw bytes have already been read."""
     findings: list[Finding] = []
     record: dict[str, Any] = {
         "path": str(path),
@@ -434,9 +465,9 @@ def validate_file(path: Path, root: Path) -> tuple[dict[str, Any], list[Finding]
     else:
         record["id"] = m.group(1)
 
-    # Read content.
+    # Decode content, translating newlines as text-mode reads do.
     try:
-        text = path.read_text(encoding="utf-8")
+        text = data.decode("utf-8").replace("\r\n", "\n").replace("\r", "\n")
     except UnicodeDecodeError:
         findings.append(Finding(
             "error", "encoding",
@@ -667,6 +698,196 @@ def validate_file(path: Path, root: Path) -> tuple[dict[str, Any], list[Finding]
     return record, findings
 
 
+# ---------------------------------------------------------------------------
+# Record cache and parallel validation
+# ---------------------------------------------------------------------------
+
+def validator_version() -> str:
+    # Any edit to this script invalidates every cached record.
+    return hashlib.sha256(Path(__file__).read_bytes()).hexdigest()[:16]
+
+
+def state_file(base: Path, root: Path, stem: str) -> Path:
+    """Default per-root state file under <base>/.cache/.
+
+    The resolved ADR root is hashed into the name, so several roots under
+    one base keep separate files instead of pruning each other's entries.
+    """
+    tag = hashlib.sha256(str(root).encode("utf-8")).hexdigest()[:12]
+    return base / ".cache" / f"{stem}-{tag}.json"
+
+
+def content_key(rel: str, data: bytes) -> str:
+    # The relative path is part of the key: filename checks and finding
+    # locations depend on it, not only on the bytes.
+    digest = hashlib.sha256(rel.encode("utf-8") + b"\0")
+    digest.update(data)
+    return digest.hexdigest()
+
+
+class RecordCache:
+    """Per-file records and findings keyed by content hash, stored as JSON.
+
+    An entry whose (size, mtime_ns) still matches is reused without reading
+    the file; otherwise the file is read and hashed, and only a changed hash
+    means re-parsing. Entries for files that no longer exist are dropped on
+    save. Entries are relative to one ADR root: a file written for another
+    root (a shared --cache-file) is ignored rather than merged.
+    """
+
+    def __init__(self, path: Path, root: Path) -> None:
+        self.path = path
+        self.root = str(root)
+        self.version = validator_version()
+        self.entries: dict[str, dict[str, Any]] = {}
+        self.updates: dict[str, dict[str, Any]] = {}
+        self.seen: set[str] = set()
+
+    def load(self) -> "RecordCache":
+        try:
+            with self.path.open("r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return self
+        if (isinstance(data, dict) and data.get("version") == self.version
+                and data.get("root") == self.root):
+            self.entries = data.get("files", {})
+        return self
+
+    def by_stat(self, rel: str, stat: list[int]) -> dict[str, Any] | None:
+        self.seen.add(rel)
+        entry = self.entries.get(rel)
+        if entry is not None and entry.get("stat") == stat:
+            return entry
+        return None
+
+    def keep(self, rels: Any) -> None:
+        # Files a partial run (a graph query) did not need to look at are
+        # still on disk; mark them so save() does not prune their entries.
+        self.seen.update(rels)
+
+    def known_key(self, rel: str) -> str | None:
+        entry = self.entries.get(rel)
+        return entry.get("key") if entry is not None else None
+
+    def put(self, rel: str, key: str, stat: list[int],
+            record: dict[str, Any], findings: list[Finding]) -> None:
+        self.updates[rel] = {
+            "key": key,
+            "stat": stat,
+            "record": {k: v for k, v in record.items() if k != "path"},
+            "findings": [f.to_dict() for f in findings],
+        }
+
+    def restamp(self, rel: str, stat: list[int]) -> None:
+        # Same content under a new mtime (checkout, touch): keep the entry,
+        # refresh the stat so the next run can skip the read.
+        entry = dict(self.entries[rel], stat=stat)
+        self.updates[rel] = entry
+
+    def restore(self, rel: str, path: Path) -> tuple[dict[str, Any], list[Finding]]:
+        entry = self.updates.get(rel) or self.entries[rel]
+        record = dict(entry["record"], path=str(path))
+        return record, [Finding.from_dict(d) for d in entry["findings"]]
+
+    def save(self) -> None:
+        if not self.updates and self.seen == set(self.entries):
+            return
+        files = {k: v for k, v in self.entries.items() if k in self.seen}
+        files.update(self.updates)
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix(".tmp")
+            # dumps() + one write uses the C encoder; dump() streams through
+            # the pure-Python one and is several times slower.
+            payload = json.dumps({"version": self.version, "root": self.root,
+                                  "files": files}, separators=(",", ":"))
+            with tmp.open("w", encoding="utf-8") as f:
+                f.write(payload)
+            os.replace(tmp, self.path)
+        except OSError:
+            pass  # The cache is an optimisation; a read-only checkout still validates.
+
+
+def file_stat(path: Path) -> list[int]:
+    st = path.stat()
+    return [st.st_size, st.st_mtime_ns]
+
+
+def validate_task(path: Path, rel: str,
+                  known_key: str | None) -> tuple[str, list[int], dict[str, Any] | None,
+                                                  list[Finding] | None]:
+    """Read, hash and (unless the hash is `known_key`) validate one file.
+
+    Module-level so it can run in a worker process. Returns
+    (key, stat, record, findings); record and findings are None on a hash hit.
+    """
+    stat = file_stat(path)
+    data = path.read_bytes()
+    key = content_key(rel, data)
+    if key == known_key:
+        return key, stat, None, None
+    record, findings = validate_bytes(path, rel, data)
+    return key, stat, record, findings
+
+
+def validate_files(files: list[Path], root: Path, jobs: int = 1,
+                   cache: RecordCache | None = None
+                   ) -> tuple[list[dict[str, Any]], list[Finding]]:
+    """Validate every file, in order; cache hits skip parsing entirely.
+
+    With `jobs` > 1 (0 = one per CPU) cache misses are parsed on a process
+    pool. Results are merged in `files` order, so output does not depend on
+    the job count.
+    """
+    rels = [relative_name(p, root) for p in files]
+    results: list[tuple[dict[str, Any], list[Finding]] | None] = [None] * len(files)
+    pending: list[int] = []
+    for i, (path, rel) in enumerate(zip(files, rels)):
+        if cache is not None and cache.by_stat(rel, file_stat(path)) is not None:
+            results[i] = cache.restore(rel, path)
+        else:
+            pending.append(i)
+
+    if jobs == 0:
+        jobs = os.cpu_count() or 1
+    paths = [files[i] for i in pending]
+    pending_rels = [rels[i] for i in pending]
+    known = [cache.known_key(rel) if cache is not None else None for rel in pending_rels]
+    if jobs <= 1 or len(pending) < 2:
+        outcomes = map(validate_task, paths, pending_rels, known)
+        for i, outcome in zip(pending, outcomes):
+            results[i] = _merge_outcome(cache, files[i], rels[i], outcome)
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+        workers = min(jobs, len(pending))
+        chunksize = max(1, len(pending) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            outcomes = pool.map(validate_task, paths, pending_rels, known, chunksize=chunksize)
+            for i, outcome in zip(pending, outcomes):
+                results[i] = _merge_outcome(cache, files[i], rels[i], outcome)
+
+    records: list[dict[str, Any]] = []
+    findings: list[Finding] = []
+    for record, file_findings in results:
+        records.append(record)
+        findings.extend(file_findings)
+    return records, findings
+
+
+def _merge_outcome(cache: RecordCache | None, path: Path, rel: str,
+                   outcome: tuple[str, list[int], dict[str, Any] | None,
+                                  list[Finding] | None]
+                   ) -> tuple[dict[str, Any], list[Finding]]:
+    key, stat, record, findings = outcome
+    if record is None:
+        cache.restamp(rel, stat)
+        return cache.restore(rel, path)
+    if cache is not None:
+        cache.put(rel, key, stat, record, findings)
+    return record, findings
+
+
 # ---------------------------------------------------------------------------
 # Corpus-level validation
 # ---------------------------------------------------------------------------
@@ -696,24 +917,29 @@ def validate_corpus(records: list[dict[str, Any]]) -> list[Finding]:
                 f"id {nid} is reused across multiple files: {paths}",
             ))
 
-    # Gaps.
+    # Gaps, as ranges: cost follows the number of ADRs, not the id span.
     if ids:
         ids_sorted = sorted(set(ids))
         lo, hi = ids_sorted[0], ids_sorted[-1]
-        present = set(ids_sorted)
-        missing = [n for n in range(lo, hi + 1) if n not in present]
-        if missing:
-            preview = ", ".join(f"{n:04d}" for n in missing[:10])
-            if len(missing) > 10:
-                preview += f", ... (+{len(missing) - 10} more)"
+        gaps = missing_ranges(ids_sorted)
+        if gaps:
+            total = sum(last - first + 1 for first, last in gaps)
+            preview = format_ranges(gaps[:10])
+            if len(gaps) > 10:
+                preview += f", ... (+{len(gaps) - 10} more ranges)"
             findings.append(Finding(
                 "warn", "id-gap",
                 f"non-contiguous ADR ids between {lo:04d} and {hi:04d}; "
-                f"missing: {preview}",
+                f"missing {total} id(s): {preview}",
+                data={
+                    "missing_count": total,
+                    "missing_ranges": [{"first": f"{first:04d}", "last": f"{last:04d}"}
+                                       for first, last in gaps],
+                },
             ))
 
     # Dangling and self references; build edges for cycle detection.
-    edges_supersedes: dict[str, set[str]] = {}
+    cycle_edges: dict[str, dict[str, set[str]]] = {gk: {} for gk in CYCLE_KEYS}
     for rec in records:
         rid = rec["id"]
         for gk in GRAPH_KEYS:
@@ -732,56 +958,331 @@ def validate_corpus(records: list[dict[str, Any]]) -> list[Finding]:
                         f"with that id exists in the corpus",
                         file=rec["rel"],
                     ))
-                if gk == "supersedes" and rid is not None:
-                    edges_supersedes.setdefault(rid, set()).add(target)
-
-    # Cycle detection over `supersedes` edges.
-    cycles = _find_cycles(edges_supersedes)
-    for cyc in cycles:
-        findings.append(Finding(
-            "error", "supersedes-cycle",
-            "circular `supersedes` chain: " + " -> ".join(cyc + [cyc[0]]),
-        ))
+                if gk in cycle_edges and rid is not None:
+                    cycle_edges[gk].setdefault(rid, set()).add(target)
+
+    # Cycle detection: every strongly connected component is one finding.
+    for gk in CYCLE_KEYS:
+        for members in find_cycles(cycle_edges[gk]):
+            cyc = shortest_cycle(cycle_edges[gk], members)
+            message = f"circular `{gk}` chain: " + " -> ".join(cyc + [cyc[0]])
+            if len(members) > len(cyc):
+                message += (f" (one of several cycles among {len(members)} ADRs: "
+                            + ", ".join(members) + ")")
+            findings.append(Finding("error", f"{gk}-cycle", message))
 
     return findings
 
 
-def _find_cycles(edges: dict[str, set[str]]) -> list[list[str]]:
-    """DFS cycle finder. Returns list of cycles (each a list of node ids)."""
-    WHITE, GRAY, BLACK = 0, 1, 2
-    color: dict[str, int] = {n: WHITE for n in edges}
-    parent: dict[str, str | None] = {}
-    cycles: list[list[str]] = []
-    seen_cycles: set[tuple[str, ...]] = set()
-
-    def dfs(u: str) -> None:
-        color[u] = GRAY
-        for v in edges.get(u, ()):
-            if v not in color:
-                color[v] = WHITE
-                parent[v] = u
-            if color[v] == WHITE:
-                parent[v] = u
-                dfs(v)
-            elif color[v] == GRAY:
-                # Reconstruct cycle from v back to v.
-                cyc = [v]
-                cur = u
-                while cur is not None and cur != v:
-                    cyc.append(cur)
-                    cur = parent.get(cur)
-                cyc.reverse()
-                key = tuple(sorted(cyc))
-                if key not in seen_cycles:
-                    seen_cycles.add(key)
-                    cycles.append(cyc)
-        color[u] = BLACK
-
-    for node in list(edges.keys()):
-        if color.get(node, WHITE) == WHITE:
-            parent[node] = None
-            dfs(node)
-    return cycles
+def missing_ranges(ids_sorted: list[int]) -> list[tuple[int, int]]:
+    """Inclusive (first, last) ranges absent between consecutive sorted unique ids."""
+    return [(prev + 1, cur - 1)
+            for prev, cur in zip(ids_sorted, ids_sorted[1:]) if cur - prev > 1]
+
+
+def format_ranges(ranges: list[tuple[int, int]]) -> str:
+    """`[(5, 41), (100, 100)]` -> `0005-0041, 0100`."""
+    return ", ".join(f"{first:04d}" if first == last else f"{first:04d}-{last:04d}"
+                     for first, last in ranges)
+
+
+def strongly_connected_components(edges: dict[str, set[str]]) -> list[list[str]]:
+    """Tarjan's algorithm with an explicit stack: O(V + E), no recursion.
+
+    Long `supersedes` chains are ordinary in old decision logs; a recursive
+    DFS would hit the interpreter's recursion limit on them.
+    """
+    index: dict[str, int] = {}
+    low: dict[str, int] = {}
+    on_stack: set[str] = set()
+    stack: list[str] = []
+    components: list[list[str]] = []
+    counter = 0
+
+    for start in edges:
+        if start in index:
+            continue
+        index[start] = low[start] = counter
+        counter += 1
+        stack.append(start)
+        on_stack.add(start)
+        work = [(start, iter(edges.get(start, ())))]
+        while work:
+            node, successors = work[-1]
+            for succ in successors:
+                if succ not in index:
+                    index[succ] = low[succ] = counter
+                    counter += 1
+                    stack.append(succ)
+                    on_stack.add(succ)
+                    work.append((succ, iter(edges.get(succ, ()))))
+                    break
+                if succ in on_stack and index[succ] < low[node]:
+                    low[node] = index[succ]
+            else:
+                # All successors done: pop the frame, propagate low-link.
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    if low[node] < low[parent]:
+                        low[parent] = low[node]
+                if low[node] == index[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == node:
+                            break
+                    components.append(component)
+    return components
+
+
+def find_cycles(edges: dict[str, set[str]]) -> list[list[str]]:
+    """Every cycle component (sorted ids), ordered by its smallest id.
+
+    A component is cyclic when it has more than one node or a self-loop.
+    """
+    cycles = [sorted(c) for c in strongly_connected_components(edges)
+              if len(c) > 1 or c[0] in edges.get(c[0], ())]
+    return sorted(cycles)
+
+
+def shortest_cycle(edges: dict[str, set[str]], members: list[str]) -> list[str]:
+    """A shortest cycle through the component's smallest id, for the message.
+
+    Breadth-first search restricted to the component, so it costs
+    O(component edges).
+    """
+    start = members[0]
+    inside = set(members)
+    parent: dict[str, str] = {}
+    frontier = [start]
+    while frontier:
+        nxt: list[str] = []
+        for node in frontier:
+            for succ in sorted(edges.get(node, ())):
+                if succ == start:
+                    path = [node]
+                    while path[-1] != start:
+                        path.append(parent[path[-1]])
+                    return path[::-1]
+                if succ in inside and succ not in parent:
+                    parent[succ] = node
+                    nxt.append(succ)
+        frontier = nxt
+    return [start]  # unreachable for a cyclic component
+
+
+# ---------------------------------------------------------------------------
+# Persistent graph index
+# ---------------------------------------------------------------------------
+
+GRAPH_SCHEMA = "doc-master.adr_graph.v1"
+
+
+class GraphIndex:
+    """ADR relationship graph persisted as JSON next to the record cache.
+
+    Holds one entry per file (id, title, status, outgoing edges, stat) plus
+    the derived maps queries need: `nodes` (id -> files), `edges` (id ->
+    kind -> target ids) and `reverse` (target id -> kind -> source ids).
+    update() touches only files whose entry changed, removing their old
+    edges and adding the new ones, so keeping the index current costs
+    O(changed edges) rather than a rebuild.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.files: dict[str, dict[str, Any]] = {}
+        self.nodes: dict[str, list[str]] = {}
+        self.edges: dict[str, dict[str, list[str]]] = {}
+        self.reverse: dict[str, dict[str, list[str]]] = {}
+        self.dirty = False
+
+    def load(self) -> "GraphIndex":
+        try:
+            with self.path.open("r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return self
+        if isinstance(data, dict) and data.get("schema") == GRAPH_SCHEMA:
+            self.files = data.get("files", {})
+            self.nodes = data.get("nodes", {})
+            self.edges = data.get("edges", {})
+            self.reverse = data.get("reverse", {})
+        return self
+
+    def save(self) -> None:
+        if not self.dirty:
+            return
+        payload = json.dumps({"schema": GRAPH_SCHEMA, "files": self.files,
+                              "nodes": self.nodes, "edges": self.edges,
+                              "reverse": self.reverse},
+                             separators=(",", ":"), sort_keys=True)
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix(".tmp")
+            with tmp.open("w", encoding="utf-8") as f:
+                f.write(payload)
+            os.replace(tmp, self.path)
+            self.dirty = False
+        except OSError:
+            pass  # Queries rebuild what they need; a read-only checkout still validates.
+
+    def stale(self, files: list[Path], root: Path) -> tuple[list[Path], dict[str, list[int]]]:
+        """Files that are new or changed since they were indexed, plus every file's stat."""
+        stats: dict[str, list[int]] = {}
+        changed: list[Path] = []
+        for path in files:
+            rel = relative_name(path, root)
+            stats[rel] = file_stat(path)
+            entry = self.files.get(rel)
+            if entry is None or entry.get("stat") != stats[rel]:
+                changed.append(path)
+        return changed, stats
+
+    def update(self, records: list[dict[str, Any]], stats: dict[str, list[int]]) -> int:
+        """Apply parsed records and drop files missing from `stats`.
+
+        Returns the number of files whose graph entry changed.
+        """
+        changed = 0
+        for rec in records:
+            fm = rec["frontmatter"] or {}
+            entry = {
+                "id": rec["id"],
+                "title": fm.get("title") if isinstance(fm.get("title"), str) else None,
+                "status": fm.get("status") if isinstance(fm.get("status"), str) else None,
+                "edges": {gk: list(rec["references"][gk]) for gk in GRAPH_KEYS},
+                "stat": stats.get(rec["rel"]),
+            }
+            old = self.files.get(rec["rel"])
+            if old == entry:
+                continue
+            self.dirty = True
+            if old is not None and all(old.get(k) == entry[k] for k in ("id", "title", "status", "edges")):
+                old["stat"] = entry["stat"]  # touched, not edited
+                continue
+            self._remove(rec["rel"])
+            self._add(rec["rel"], entry)
+            changed += 1
+        for rel in [rel for rel in self.files if rel not in stats]:
+            self._remove(rel)
+            self.dirty = True
+            changed += 1
+        return changed
+
+    def refresh(self, files: list[Path], root: Path, jobs: int = 1,
+                cache: RecordCache | None = None) -> int:
+        """Re-parse only the files changed since the last update, then apply them."""
+        changed, stats = self.stale(files, root)
+        if cache is not None:
+            cache.keep(stats)
+        records, _ = validate_files(changed, root, jobs, cache)
+        return self.update(records, stats)
+
+    def _add(self, rel: str, entry: dict[str, Any]) -> None:
+        self.files[rel] = entry
+        nid = entry["id"]
+        if nid is None:
+            return  # no filename id: its edges have no source node
+        self.nodes.setdefault(nid, []).append(rel)
+        for gk, targets in entry["edges"].items():
+            for target in targets:
+                self.edges.setdefault(nid, {}).setdefault(gk, []).append(target)
+                self.reverse.setdefault(target, {}).setdefault(gk, []).append(nid)
+
+    def _remove(self, rel: str) -> None:
+        entry = self.files.pop(rel, None)
+        if entry is None or entry["id"] is None:
+            return
+        nid = entry["id"]
+        _discard(self.nodes, nid, rel)
+        for gk, targets in entry["edges"].items():
+            for target in targets:
+                _discard(self.edges.get(nid, {}), gk, target)
+                _discard(self.reverse.get(target, {}), gk, nid)
+            if not self.edges.get(nid, True):
+                del self.edges[nid]
+        for target in {t for targets in entry["edges"].values() for t in targets}:
+            if not self.reverse.get(target, True):
+                del self.reverse[target]
+
+    # Queries ---------------------------------------------------------------
+
+    def sources(self, nid: str, kind: str) -> list[str]:
+        """Ids with a `kind` edge to `nid`, e.g. who supersedes it."""
+        return sorted(set(self.reverse.get(nid, {}).get(kind, ())))
+
+    def targets(self, nid: str, kind: str) -> list[str]:
+        return sorted(set(self.edges.get(nid, {}).get(kind, ())))
+
+    def chain(self, nid: str, kind: str = "supersedes") -> dict[str, list[str]]:
+        """Transitive `kind` closure in both directions, nearest first."""
+        return {
+            "forward": self._walk(nid, self.edges, kind),
+            "backward": self._walk(nid, self.reverse, kind),
+        }
+
+    def orphans(self) -> list[str]:
+        """Ids with no edge of any kind in either direction."""
+        return sorted(nid for nid in self.nodes
+                      if not self.edges.get(nid) and not self.reverse.get(nid))
+
+    @staticmethod
+    def _walk(start: str, adjacency: dict[str, dict[str, list[str]]], kind: str) -> list[str]:
+        order: list[str] = []
+        seen = {start}
+        frontier = [start]
+        while frontier:
+            nxt: list[str] = []
+            for node in frontier:
+                for other in sorted(set(adjacency.get(node, {}).get(kind, ()))):
+                    if other not in seen:
+                        seen.add(other)
+                        order.append(other)
+                        nxt.append(other)
+            frontier = nxt
+        return order
+
+
+def _discard(mapping: dict[str, list[str]], key: str, value: str) -> None:
+    values = mapping.get(key)
+    if values is None:
+        return
+    try:
+        values.remove(value)
+    except ValueError:
+        return
+    if not values:
+        del mapping[key]
+
+
+def run_graph_query(graph: GraphIndex, query: str, nid: str | None,
+                    fmt: str) -> int:
+    if nid is not None and nid not in graph.nodes and nid not in graph.reverse:
+        print(f"[ERROR] no ADR with id {nid} in the graph index", file=sys.stderr)
+        return 1
+    if query == "who-supersedes":
+        result: Any = graph.sources(nid, "supersedes")
+        text = [f"{nid} is superseded by: {', '.join(result) or '(nothing)'}"]
+    elif query == "chain":
+        chain = graph.chain(nid)
+        result = {"supersedes": chain["forward"], "superseded_by": chain["backward"]}
+        text = [f"{nid} supersedes (transitively): {', '.join(result['supersedes']) or '(nothing)'}",
+                f"{nid} is superseded by (transitively): "
+                f"{', '.join(result['superseded_by']) or '(nothing)'}"]
+    else:
+        result = graph.orphans()
+        text = [f"{len(result)} ADR(s) with no supersedes / amends / relates-to edges"
+                + (": " + ", ".join(result) if result else "")]
+    if fmt == "json":
+        print(json.dumps({"schema": "doc-master.adr_graph_query.v1", "query": query, "id": nid,
+                          "result": result}, indent=2))
+    else:
+        print("\n".join(text))
+    return 0
 
 
 # ---------------------------------------------------------------------------
@@ -887,7 +1388,40 @@ def main(argv: list[str] | None = None) -> int:
     parser.add_argument("--base", default=".",
                         help="Repository base for autodetection "
                              "(default: current working directory).")
+    parser.add_argument("--jobs", "-j", type=int, default=1,
+                        help="Worker processes for parsing ADRs "
+                             "(default: 1; 0 = one per CPU).")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Re-parse every ADR instead of reusing cached "
+                             "per-file results.")
+    parser.add_argument("--cache-file", default=None,
+                        help="Record cache location "
+                             "(default: <base>/.cache/validate_adrs-<root hash>.json).")
+    parser.add_argument("--graph-file", default=None,
+                        help="Graph index location "
+                             "(default: <base>/.cache/adr_graph-<root hash>.json).")
+    parser.add_argument("--no-graph", action="store_true",
+                        help="Do not update the persistent graph index.")
+    query = parser.add_mutually_exclusive_group()
+    query.add_argument("--who-supersedes", metavar="ID",
+                       help="Print the ADRs that supersede ID, from the graph index, and exit.")
+    query.add_argument("--chain", metavar="ID",
+                       help="Print ID's transitive supersedes chain in both directions and exit.")
+    query.add_argument("--orphans", action="store_true",
+                       help="Print ADRs with no relationship edges and exit.")
     args = parser.parse_args(argv)
+    if args.jobs < 0:
+        parser.error("--jobs must be >= 0")
+    query_name, query_id = None, None
+    if args.who_supersedes or args.chain:
+        query_name = "who-supersedes" if args.who_supersedes else "chain"
+        query_id = normalize_id(args.who_supersedes or args.chain)
+        if query_id is None:
+            parser.error(f"--{query_name} needs an ADR id such as 0042")
+    elif args.orphans:
+        query_name = "orphans"
+    if query_name and args.no_graph:
+        parser.error("graph queries need the graph index; drop --no-graph")
 
     base = Path(args.base).resolve()
     fallback = False
@@ -927,12 +1461,30 @@ def main(argv: list[str] | None = None) -> int:
             print(msg)
         return 1 if args.strict else 0
 
-    records: list[dict[str, Any]] = []
-    all_findings: list[Finding] = []
-    for f in files:
-        rec, fnds = validate_file(f, root)
-        records.append(rec)
-        all_findings.extend(fnds)
+    cache = None
+    if not args.no_cache:
+        cache_file = (Path(args.cache_file) if args.cache_file
+                      else state_file(base, root, "validate_adrs"))
+        cache = RecordCache(cache_file, root).load()
+    graph = None
+    if not args.no_graph:
+        graph = GraphIndex(Path(args.graph_file) if args.graph_file
+                           else state_file(base, root, "adr_graph")).load()
+
+    if query_name:
+        # Answer from the index; only files changed since it was written are parsed.
+        graph.refresh(files, root, args.jobs, cache)
+        graph.save()
+        if cache is not None:
+            cache.save()
+        return run_graph_query(graph, query_name, query_id, args.format)
+
+    records, all_findings = validate_files(files, root, args.jobs, cache)
+    if cache is not None:
+        cache.save()
+    if graph is not None:
+        graph.update(records, {rec["rel"]: file_stat(Path(rec["path"])) for rec in records})
+        graph.save()
 
     all_findings.extend(validate_corpus(records))
 
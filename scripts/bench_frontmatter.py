@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+bench_frontmatter.py - Per-file cost of frontmatter parsing in validate_plugins.py.
+
+Compares the legacy path (import yaml + pure-Python safe_load per file, then
+the frontmatter block split and line-parsed twice more for the description
+and model checks) against the shared Frontmatter object, which parses each
+document once with libyaml's CSafeLoader when it is available.
+
+Usage:
+  python scripts/bench_frontmatter.py               # All markdown under plugins/
+  python scripts/bench_frontmatter.py --repeat 10   # More iterations per variant
+  python scripts/bench_frontmatter.py --json        # JSON output
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+import validate_plugins as vp  # noqa: E402
+
+
+def legacy(text):
+    # Mirrors the pre-Frontmatter agent path: validate_frontmatter(),
+    # frontmatter() and parse_frontmatter() each re-split the document.
+    fm_text = vp.frontmatter(text)
+    if fm_text is not None:
+        try:
+            import yaml
+            yaml.safe_load(fm_text)
+        except Exception:
+            pass
+    fm_text = vp.frontmatter(text)
+    fm = vp.parse_frontmatter(text) or {}
+    return (fm_text is not None and "model: inherit" in fm_text), fm.get("description", "")
+
+
+def shared(text):
+    fm = vp.Frontmatter(text)
+    return fm.has_value("model", "inherit"), fm.get_str("description")
+
+
+def time_variant(func, texts, repeat):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for text in texts:
+            func(text)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark validate_plugins frontmatter parsing")
+    parser.add_argument("--repeat", type=int, default=5, help="Iterations per variant; best is reported (default: 5)")
+    parser.add_argument("--json", action="store_true", help="Output results as JSON")
+    args = parser.parse_args()
+
+    texts = [vp.read_text(f.path) for f in vp.FileIndex.scan().files if f.kind]
+    texts = [t for t in texts if vp.frontmatter(t) is not None]
+    if not texts:
+        print("No markdown files with frontmatter found under plugins/", file=sys.stderr)
+        sys.exit(1)
+
+    results = {}
+    for name, func in (("legacy", legacy), ("shared", shared)):
+        func(texts[0])  # warm imports so they are not charged to the first file
+        total = time_variant(func, texts, args.repeat)
+        results[name] = {"total_ms": total * 1000, "per_file_us": total / len(texts) * 1e6}
+    speedup = results["legacy"]["total_ms"] / results["shared"]["total_ms"]
+
+    if args.json:
+        print(json.dumps({"files": len(texts), "repeat": args.repeat,
+                          "results": results, "speedup": speedup}, indent=2))
+        return
+    print("=== Frontmatter Benchmark ===")
+    print(f"Files:   {len(texts)}")
+    print(f"Repeat:  {args.repeat} (best run reported)")
+    print()
+    print(f"{'VARIANT':<10} {'TOTAL MS':>10} {'PER FILE US':>12}")
+    print("-" * 34)
+    for name, r in results.items():
+        print(f"{name:<10} {r['total_ms']:>10.1f} {r['per_file_us']:>12.1f}")
+    print()
+    print(f"Speedup: {speedup:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+bench_startup.py - Startup-time budget for the repo's command-line scripts.
+
+Runs each entry point in a fresh interpreter and reports wall time, then
+re-runs it under `python -X importtime` to show which imports dominate.
+Pre-commit hooks invoke these scripts many times a day, so startup matters
+more than steady-state throughput for the short commands.
+
+Usage:
+  python scripts/bench_startup.py                   # Default command set, 10 runs each
+  python scripts/bench_startup.py --repeat 30       # More runs per command
+  python scripts/bench_startup.py --budget 150      # Exit 1 if any median exceeds 150 ms
+  python scripts/bench_startup.py --imports 15      # Show the 15 slowest imports per command
+  python scripts/bench_startup.py --json            # JSON output
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).parent
+REPO_ROOT = SCRIPT_DIR.parent
+
+# (label, script, arguments). Output is discarded; only timing matters.
+COMMANDS = (
+    ("validate_plugins --help", "validate_plugins.py", ["--help"]),
+    ("validate_plugins --list-rules", "validate_plugins.py", ["--list-rules"]),
+    ("validate_plugins --fast", "validate_plugins.py", ["--fast"]),
+    ("validate_plugins", "validate_plugins.py", []),
+    ("version_ops --help", "version_ops.py", ["--help"]),
+    ("version_ops --validate", "version_ops.py", ["--validate", "--quiet"]),
+)
+
+
+def run(script, args, extra=()):
+    cmd = [sys.executable, *extra, str(SCRIPT_DIR / script), *args]
+    start = time.perf_counter()
+    result = subprocess.run(cmd, cwd=REPO_ROOT, stdout=subprocess.DEVNULL,
+                            stderr=subprocess.PIPE, text=True)
+    return time.perf_counter() - start, result
+
+
+def import_times(script, args):
+    # -X importtime writes "import time: self | cumulative | name" to stderr.
+    _, result = run(script, args, ("-X", "importtime"))
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        rows.append({"module": name.strip(), "self_ms": int(self_us) / 1000,
+                     "cumulative_ms": int(cumulative_us) / 1000})
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark startup time of the repo's scripts")
+    parser.add_argument("--repeat", type=int, default=10, help="Runs per command (default: 10)")
+    parser.add_argument("--imports", type=int, default=8, metavar="N",
+                        help="Slowest imports to list per command, by self time (default: 8)")
+    parser.add_argument("--budget", type=float, metavar="MS",
+                        help="Fail if any command's median wall time exceeds MS milliseconds")
+    parser.add_argument("--json", action="store_true", help="Output results as JSON")
+    args = parser.parse_args()
+
+    results = []
+    for label, script, cmd_args in COMMANDS:
+        run(script, cmd_args)  # warm the OS file cache and __pycache__
+        times = [run(script, cmd_args)[0] * 1000 for _ in range(args.repeat)]
+        imports = import_times(script, cmd_args)
+        results.append({
+            "command": label,
+            "median_ms": statistics.median(times),
+            "min_ms": min(times),
+            "imports_ms": sum(r["self_ms"] for r in imports),
+            "slowest_imports": sorted(imports, key=lambda r: r["self_ms"], reverse=True)[:args.imports],
+        })
+    over = [r["command"] for r in results if args.budget is not None and r["median_ms"] > args.budget]
+
+    if args.json:
+        print(json.dumps({"repeat": args.repeat, "budget_ms": args.budget,
+                          "results": results, "over_budget": over}, indent=2))
+    else:
+        print("=== Startup Benchmark ===")
+        print(f"Python:  {sys.version.split()[0]}   Repeat: {args.repeat}")
+        print()
+        print(f"{'COMMAND':<32} {'MEDIAN MS':>10} {'MIN MS':>8} {'IMPORTS MS':>11}")
+        print("-" * 64)
+        for r in results:
+            flag = "  over budget" if r["command"] in over else ""
+            print(f"{r['command']:<32} {r['median_ms']:>10.1f} {r['min_ms']:>8.1f} {r['imports_ms']:>11.1f}{flag}")
+        for r in results:
+            print()
+            print(f"{r['command']} - slowest imports (self ms):")
+            for imp in r["slowest_imports"]:
+                print(f"  {imp['self_ms']:>7.2f}  {imp['module']}")
+    sys.exit(1 if over else 0)
+
+
+if __name__ == "__main__":
+    main()
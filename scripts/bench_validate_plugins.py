@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""
+bench_validate_plugins.py - Throughput benchmark for validate_plugins.py on a synthetic marketplace.
+
+Generates a deterministic marketplace.json plus N plugins (agents, skills,
+skill reference files) in a temporary directory, then times run_validation()
+end to end and per check, reporting files/sec and MB/sec. The same seed and
+size options always produce the same corpus, so results can be compared
+against a saved baseline.
+
+Usage:
+  python scripts/bench_validate_plugins.py                          # 40 plugins, defaults
+  python scripts/bench_validate_plugins.py --plugins 400 --jobs 0   # Scale up, all CPUs
+  python scripts/bench_validate_plugins.py --save-baseline base.json
+  python scripts/bench_validate_plugins.py --baseline base.json     # Compare against it
+  python scripts/bench_validate_plugins.py --keep /tmp/synthetic    # Keep the generated tree
+  python scripts/bench_validate_plugins.py --json                   # JSON output
+"""
+
+import argparse
+import json
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+import validate_plugins as vp  # noqa: E402
+
+VOCABULARY = (
+    "plugin agent skill marketplace validate frontmatter description workflow "
+    "command reference pattern example deploy configure review cache index "
+    "request response service pipeline release version keyword search the a "
+    "of to and for with when this that use run build test"
+).split()
+
+FENCE_BODIES = (
+    ("bash", "set -euo pipefail\necho \"building $TARGET\"\nmake -j4 all"),
+    ("python", "def main():\n    return run_validation(jobs=4)"),
+    ("json", "{\n  \"name\": \"example\",\n  \"version\": \"1.0.0\"\n}"),
+    ("yaml", "steps:\n  - run: python scripts/validate_plugins.py --strict"),
+)
+
+
+def prose(rng, words, fence_density):
+    # `fence_density` is fenced code blocks per 1,000 words of prose.
+    fences = int(words * fence_density / 1000)
+    gap = words // (fences + 1)
+    out = []
+    written = 0
+    for _ in range(fences + 1):
+        n = min(gap, words - written)
+        for start in range(0, n, 12):
+            out.append(" ".join(rng.choice(VOCABULARY) for _ in range(min(12, n - start))))
+        written += n
+        if written < words:
+            lang, body = rng.choice(FENCE_BODIES)
+            out.append(f"\n```{lang}\n{body}\n```\n")
+    return "\n".join(out) + "\n"
+
+
+def document(rng, name, description, words, fence_density, model=False):
+    lines = ["---", f"name: {name}", f"description: {description}"]
+    if model:
+        lines.append("model: inherit")
+    lines.append("---")
+    return "\n".join(lines) + f"\n\n# {name}\n\n" + prose(rng, words, fence_density)
+
+
+def generate(root, plugins=40, agents=2, skills=3, references=2, words=1200,
+             reference_words=4000, fence_density=4.0, seed=1):
+    """Write a synthetic marketplace under `root`; return (file_count, byte_count)."""
+    rng = random.Random(seed)
+    root = Path(root)
+    (root / ".claude-plugin").mkdir(parents=True, exist_ok=True)
+    entries = []
+    files = 0
+    size = 0
+
+    def write(path, text):
+        nonlocal files, size
+        path.parent.mkdir(parents=True, exist_ok=True)
+        data = text.encode("utf-8")
+        path.write_bytes(data)
+        files += 1
+        size += len(data)
+
+    for p in range(plugins):
+        name = f"synthetic-{p:04d}-master"
+        description = f"PROACTIVELY assists with synthetic topic {p}. Provides benchmark coverage."
+        entries.append({"name": name, "version": "1.0.0", "description": description,
+                        "keywords": [f"topic-{p}", "synthetic"]})
+        plugin_dir = root / "plugins" / name
+        manifest = {"name": name, "version": "1.0.0", "description": description,
+                    "author": {"name": "Benchmark"}, "license": "MIT",
+                    "keywords": [f"topic-{p}", "synthetic"]}
+        write(plugin_dir / ".claude-plugin" / "plugin.json", json.dumps(manifest, indent=2) + "\n")
+        write(plugin_dir / "README.md", f"# {name}\n\n" + prose(rng, 300, fence_density))
+        for a in range(agents):
+            write(plugin_dir / "agents" / f"agent-{a}.md",
+                  document(rng, f"agent-{a}", description, words, fence_density, model=True))
+        for s in range(skills):
+            skill_dir = plugin_dir / "skills" / f"skill-{s}"
+            write(skill_dir / "SKILL.md",
+                  document(rng, f"skill-{s}", description, words, fence_density))
+            for r in range(references):
+                write(skill_dir / "references" / f"reference-{r}.md",
+                      f"# Reference {r}\n\n" + prose(rng, reference_words, fence_density))
+
+    marketplace = {"name": "synthetic-marketplace", "plugins": entries}
+    write(root / ".claude-plugin" / "marketplace.json", json.dumps(marketplace, indent=2) + "\n")
+    return files, size
+
+
+def best_of(repeat, func):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def run_benchmark(root, files, size, repeat, jobs):
+    vp.set_repo_root(root)
+    cold = best_of(repeat, lambda: vp.run_validation(jobs=jobs, use_cache=False))
+
+    # Warm-cache run: populate once, then time reruns that hit the cache.
+    vp.run_validation(jobs=jobs, use_cache=True)
+    warm = best_of(repeat, lambda: vp.run_validation(jobs=jobs, use_cache=True))
+
+    vp.PROFILER = vp.Profiler()
+    try:
+        vp.run_validation(jobs=jobs, use_cache=False)
+        vp.PROFILER.stop()
+        checks = vp.PROFILER.checks()
+    finally:
+        vp.PROFILER = None
+
+    mb = size / (1024 * 1024)
+    return {
+        "files": files,
+        "megabytes": mb,
+        "jobs": jobs,
+        "cold": {"seconds": cold, "files_per_sec": files / cold, "mb_per_sec": mb / cold},
+        "warm_cache": {"seconds": warm, "files_per_sec": files / warm, "mb_per_sec": mb / warm},
+        "checks": checks,
+    }
+
+
+def print_report(config, result, baseline=None):
+    print("=== validate_plugins Benchmark ===")
+    print(f"Corpus:  {config['plugins']} plugins, {result['files']} files, {result['megabytes']:.1f} MB (seed {config['seed']})")
+    print(f"Jobs:    {result['jobs']}   Repeat: {config['repeat']} (best run reported)")
+    print()
+    print(f"{'RUN':<12} {'SECONDS':>9} {'FILES/S':>10} {'MB/S':>8} {'VS BASELINE':>12}")
+    print("-" * 55)
+    for run in ("cold", "warm_cache"):
+        r = result[run]
+        delta = ""
+        if baseline and run in baseline:
+            delta = f"{(r['seconds'] / baseline[run]['seconds'] - 1) * 100:+.1f}%"
+        print(f"{run:<12} {r['seconds']:>9.3f} {r['files_per_sec']:>10.0f} {r['mb_per_sec']:>8.1f} {delta:>12}")
+    print()
+    print(f"{'CHECK':<26} {'CALLS':>7} {'TOTAL MS':>10} {'MB/S':>8}")
+    print("-" * 54)
+    for t in result["checks"]:
+        rate = (t["bytes"] / (1024 * 1024)) / t["seconds"] if t["bytes"] and t["seconds"] else 0
+        print(f"{t['check']:<26} {t['calls']:>7} {t['seconds'] * 1000:>10.1f} {rate:>8.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark validate_plugins.py on a synthetic marketplace")
+    parser.add_argument("--plugins", type=int, default=40, help="Number of plugins (default: 40)")
+    parser.add_argument("--agents", type=int, default=2, help="Agents per plugin (default: 2)")
+    parser.add_argument("--skills", type=int, default=3, help="Skills per plugin (default: 3)")
+    parser.add_argument("--references", type=int, default=2, help="Reference files per skill (default: 2)")
+    parser.add_argument("--words", type=int, default=1200, help="Words per agent/SKILL.md (default: 1200)")
+    parser.add_argument("--reference-words", type=int, default=4000, help="Words per reference file (default: 4000)")
+    parser.add_argument("--fence-density", type=float, default=4.0,
+                        help="Fenced code blocks per 1,000 words (default: 4)")
+    parser.add_argument("--seed", type=int, default=1, help="Random seed for the corpus (default: 1)")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per mode; best is reported (default: 3)")
+    parser.add_argument("--jobs", "-j", type=int, default=1, help="Passed to run_validation (0 = one per CPU)")
+    parser.add_argument("--keep", metavar="DIR", help="Generate into DIR and keep it instead of a temp dir")
+    parser.add_argument("--baseline", metavar="PATH", help="Compare against a saved --save-baseline file")
+    parser.add_argument("--save-baseline", metavar="PATH", help="Write results as a baseline JSON file")
+    parser.add_argument("--json", action="store_true", help="Output results as JSON")
+    args = parser.parse_args()
+
+    config = {k: getattr(args, k) for k in ("plugins", "agents", "skills", "references", "words",
+                                            "reference_words", "fence_density", "seed", "repeat")}
+    baseline = None
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            saved = json.load(f)
+        if saved.get("config") != config:
+            print("[WARN] baseline was generated with different corpus options", file=sys.stderr)
+        baseline = saved.get("result")
+
+    def bench(root):
+        files, size = generate(root, args.plugins, args.agents, args.skills, args.references,
+                               args.words, args.reference_words, args.fence_density, args.seed)
+        return run_benchmark(root, files, size, args.repeat, args.jobs)
+
+    if args.keep:
+        result = bench(Path(args.keep))
+    else:
+        with tempfile.TemporaryDirectory(prefix="validate-plugins-bench-") as tmp:
+            result = bench(Path(tmp))
+
+    if args.save_baseline:
+        with open(args.save_baseline, "w", encoding="utf-8") as f:
+            json.dump({"config": config, "result": result}, f, indent=2)
+            f.write("\n")
+    if args.json:
+        print(json.dumps({"config": config, "result": result, "baseline": baseline}, indent=2))
+    else:
+        print_report(config, result, baseline)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,334 @@
+#!/usr/bin/env python3
+"""
+manifest_schema.py - Compiled JSON Schema validators for marketplace.json and plugin.json.
+
+The schemas in scripts/schemas/ are the single definition of which fields a
+manifest may carry and what shape they take; validate_plugins.py and
+version_ops.py both validate against them. Each schema is compiled once into
+nested closures, so validating a document is a walk over the data with no
+schema interpretation left to do. Every violation is reported in one pass
+with an RFC 6901 JSON pointer to the offending value.
+
+Supported keywords (the subset the manifests need): type, required,
+properties, additionalProperties, items, minLength, maxLength, pattern, enum,
+minItems, maxItems, uniqueItems and local $ref ("#/definitions/...").
+
+Usage:
+  python scripts/manifest_schema.py                         # Validate the repo's manifests
+  python scripts/manifest_schema.py plugin path/to/plugin.json
+  python scripts/manifest_schema.py marketplace path/to/marketplace.json
+  python scripts/manifest_schema.py --bench 1000            # Time 1,000 plugin.json validations
+"""
+
+import argparse
+import json
+import re
+import sys
+import time
+from collections import namedtuple
+from pathlib import Path
+
+SCHEMA_DIR = Path(__file__).parent / "schemas"
+SCHEMAS = {
+    "marketplace": SCHEMA_DIR / "marketplace.schema.json",
+    "plugin": SCHEMA_DIR / "plugin.schema.json",
+}
+
+SchemaError = namedtuple("SchemaError", "pointer keyword message")
+
+# Python types per JSON type; bool is a subclass of int but not a JSON number.
+PY_TYPES = {
+    "object": dict,
+    "array": list,
+    "string": str,
+    "integer": int,
+    "number": (int, float),
+    "boolean": bool,
+    "null": type(None),
+}
+
+_schemas = {}
+_validators = {}
+
+
+def escape(token):
+    """Escape one JSON pointer reference token (RFC 6901)."""
+    return str(token).replace("~", "~0").replace("/", "~1")
+
+
+def unescape(token):
+    return token.replace("~1", "/").replace("~0", "~")
+
+
+def json_type(value):
+    if isinstance(value, bool):
+        return "boolean"
+    for name in ("null", "integer", "number", "string", "array", "object"):
+        if isinstance(value, PY_TYPES[name]):
+            return name
+    return type(value).__name__
+
+
+def resolve(root, ref):
+    if not ref.startswith("#"):
+        raise ValueError(f"only local $ref is supported: {ref!r}")
+    node = root
+    for token in ref[1:].split("/")[1:]:
+        node = node[unescape(token)]
+    return node
+
+
+def compile_pattern(source):
+    """Compile a JSON Schema pattern with ECMA-262 anchoring.
+
+    Python's `$` also matches before a trailing newline, so "1.2.3\\n" would
+    pass a `$`-anchored pattern; each `$` outside a character class becomes
+    `\\Z`, which matches only at the very end.
+    """
+    out = []
+    escaped = in_class = False
+    for char in source:
+        if escaped:
+            escaped = False
+        elif char == "\\":
+            escaped = True
+        elif char == "[":
+            in_class = True
+        elif char == "]":
+            in_class = False
+        elif char == "$" and not in_class:
+            char = r"\Z"
+        out.append(char)
+    return re.compile("".join(out))
+
+
+def accept(value):
+    return None
+
+
+def compile_schema(schema):
+    """Compile a schema dict into validate(instance) -> list of SchemaError.
+
+    An empty list means the instance is valid. Compiled checks return None
+    for a valid value, so the common case allocates nothing; failures come
+    back as [reversed path, keyword, message] and each enclosing object or
+    array appends its key on the way out.
+    """
+    refs = {}
+
+    def compile_ref(ref):
+        # Compile each $ref target once; the indirection through `refs` lets
+        # definitions refer to themselves.
+        if ref not in refs:
+            refs[ref] = accept
+            refs[ref] = compile_node(resolve(schema, ref))
+        return lambda value: refs[ref](value)
+
+    def compile_node(node):
+        if node is True or node == {}:
+            return accept
+        if node is False:
+            return lambda value: [[[], "false", "no value is allowed here"]]
+        if "$ref" in node:
+            return compile_ref(node["$ref"])
+
+        checks = []
+        if "enum" in node:
+            allowed = node["enum"]
+            shown = ", ".join(json.dumps(a) for a in allowed)
+
+            def check_enum(value):
+                if value not in allowed:
+                    return [[[], "enum", f"must be one of {shown}"]]
+            checks.append(check_enum)
+        if "required" in node or "properties" in node or "additionalProperties" in node:
+            checks.append(compile_object(node))
+        if "items" in node or "minItems" in node or "maxItems" in node or "uniqueItems" in node:
+            checks.append(compile_array(node))
+        if "minLength" in node or "maxLength" in node or "pattern" in node:
+            checks.append(compile_string(node))
+
+        def run_checks(value):
+            errors = None
+            for check in checks:
+                found = check(value)
+                if found:
+                    errors = found if errors is None else errors + found
+            return errors
+        body = checks[0] if len(checks) == 1 else run_checks if checks else accept
+
+        if "type" not in node:
+            return body
+        names = [node["type"]] if isinstance(node["type"], str) else list(node["type"])
+        py_types = tuple(PY_TYPES[name] for name in names)
+        allow_bool = "boolean" in names
+        label = " or ".join(names)
+
+        def validate(value):
+            # A value of the wrong type gets one error; its other keywords
+            # would only restate it.
+            if not isinstance(value, py_types) or (value.__class__ is bool and not allow_bool):
+                return [[[], "type", f"expected {label}, got {json_type(value)}"]]
+            return body(value)
+        return validate
+
+    def compile_object(node):
+        required = tuple(node.get("required", ()))
+        properties = {key: compile_node(sub) for key, sub in node.get("properties", {}).items()}
+        additional = node.get("additionalProperties", True)
+        extra = None if additional in (True, False) else compile_node(additional)
+
+        def check_object(value):
+            if not isinstance(value, dict):
+                return None
+            errors = [[[key], "required", f"missing required field: {key}"]
+                      for key in required if key not in value]
+            for key, item in value.items():
+                check = properties.get(key)
+                if check is not None:
+                    found = check(item)
+                elif additional is False:
+                    found = [[[], "additionalProperties", f"unknown field: {key}"]]
+                elif extra is not None:
+                    found = extra(item)
+                else:
+                    continue
+                if found:
+                    for error in found:
+                        error[0].append(key)
+                    errors.extend(found)
+            return errors or None
+        return check_object
+
+    def compile_array(node):
+        items = compile_node(node["items"]) if "items" in node else None
+        min_items = node.get("minItems")
+        max_items = node.get("maxItems")
+        unique = node.get("uniqueItems", False)
+
+        def check_array(value):
+            if not isinstance(value, list):
+                return None
+            errors = []
+            if min_items is not None and len(value) < min_items:
+                errors.append([[], "minItems", f"has {len(value)} items; minimum is {min_items}"])
+            if max_items is not None and len(value) > max_items:
+                errors.append([[], "maxItems", f"has {len(value)} items; limit is {max_items}"])
+            if unique:
+                seen = set()
+                for i, item in enumerate(value):
+                    key = json.dumps(item, sort_keys=True)
+                    if key in seen:
+                        errors.append([[i], "uniqueItems", f"duplicate item {item!r}"])
+                    seen.add(key)
+            if items is not None and items is not accept:
+                for i, item in enumerate(value):
+                    found = items(item)
+                    if found:
+                        for error in found:
+                            error[0].append(i)
+                        errors.extend(found)
+            return errors or None
+        return check_array
+
+    def compile_string(node):
+        min_length = node.get("minLength")
+        max_length = node.get("maxLength")
+        pattern = compile_pattern(node["pattern"]) if "pattern" in node else None
+        expected = node.get("description") or f"a match for {node.get('pattern')}"
+
+        def check_string(value):
+            if not isinstance(value, str):
+                return None
+            errors = None
+            if min_length is not None and len(value) < min_length:
+                message = "must not be empty" if min_length == 1 else \
+                    f"is {len(value)} characters; minimum is {min_length}"
+                errors = [[[], "minLength", message]]
+            if max_length is not None and len(value) > max_length:
+                errors = (errors or []) + [[[], "maxLength",
+                                            f"is {len(value)} characters; limit is {max_length}"]]
+            if pattern is not None and not pattern.search(value):
+                errors = (errors or []) + [[[], "pattern", f"{value!r} is not {expected}"]]
+            return errors
+        return check_string
+
+    root = compile_node(schema)
+
+    def validate(instance):
+        found = root(instance)
+        if not found:
+            return []
+        return [SchemaError("".join("/" + escape(t) for t in reversed(path)), keyword, message)
+                for path, keyword, message in found]
+    return validate
+
+
+def load_schema(name):
+    """Parsed schema document for a name in SCHEMAS, read once per process."""
+    if name not in _schemas:
+        with SCHEMAS[name].open("r", encoding="utf-8") as f:
+            _schemas[name] = json.load(f)
+    return _schemas[name]
+
+
+def load_validator(name):
+    """Compiled validator for a schema in SCHEMAS ("marketplace" or "plugin"), built once per process."""
+    if name not in _validators:
+        _validators[name] = compile_schema(load_schema(name))
+    return _validators[name]
+
+
+def format_error(error):
+    return f"{error.pointer or '/'}: {error.message}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Validate manifests against scripts/schemas/")
+    parser.add_argument("schema", nargs="?", choices=sorted(SCHEMAS), help="Schema to validate PATH against")
+    parser.add_argument("path", nargs="?", type=Path, help="Manifest to validate")
+    parser.add_argument("--bench", type=int, metavar="N",
+                        help="Time validating N plugin.json documents drawn from the repo")
+    args = parser.parse_args()
+    if (args.schema is None) != (args.path is None):
+        parser.error("give both SCHEMA and PATH, or neither to check the whole repo")
+
+    if args.schema:
+        targets = [(args.schema, args.path)]
+    else:
+        root = Path(__file__).parent.parent
+        targets = [("marketplace", root / ".claude-plugin" / "marketplace.json")]
+        targets += [("plugin", p) for p in sorted(root.glob("plugins/*/.claude-plugin/plugin.json"))]
+
+    documents = []
+    failed = 0
+    for name, path in targets:
+        try:
+            with path.open("r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError) as exc:
+            print(f"{path}: {exc}")
+            failed += 1
+            continue
+        documents.append((name, data))
+        errors = load_validator(name)(data)
+        for error in errors:
+            print(f"{path}: {format_error(error)}")
+        failed += bool(errors)
+    print(f"{len(targets)} documents checked, {failed} invalid")
+
+    if args.bench:
+        manifests = [data for name, data in documents if name == "plugin"] or [{}]
+        manifests = (manifests * (args.bench // len(manifests) + 1))[:args.bench]
+        validate = load_validator("plugin")
+        start = time.perf_counter()
+        for data in manifests:
+            validate(data)
+        elapsed = time.perf_counter() - start
+        print(f"Validated {len(manifests)} plugin.json documents in {elapsed * 1000:.1f} ms "
+              f"({elapsed / len(manifests) * 1e6:.1f} us each)")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -5,20 +5,41 @@ validate_plugins.py - Read-only quality gate for Claude Code marketplace plugins
 Usage:
   python scripts/validate_plugins.py                # Validate all plugins
   python scripts/validate_plugins.py --json         # JSON output
+  python scripts/validate_plugins.py --format ndjson  # Stream one JSON finding per line
+  python scripts/validate_plugins.py --format sarif   # SARIF 2.1.0 for code-scanning upload
   python scripts/validate_plugins.py --strict       # Warnings also fail
   python scripts/validate_plugins.py --plugin NAME  # Validate one plugin
+  python scripts/validate_plugins.py --jobs 0       # Validate plugins in parallel (0 = all CPUs)
+  python scripts/validate_plugins.py --no-cache     # Re-validate every file, ignoring .cache/
+  python scripts/validate_plugins.py --changed-since origin/main  # Only files changed since REF
+  python scripts/validate_plugins.py --watch        # Revalidate on save, print finding changes
+  python scripts/validate_plugins.py --serve        # JSON-RPC on stdin/stdout for editors/hooks
+  python scripts/validate_plugins.py --serve --socket /tmp/validate_plugins.sock
+  python scripts/validate_plugins.py --profile      # Per-check/plugin timing table on stderr
+  python scripts/validate_plugins.py --profile --profile-json timings.json --cprofile run.prof
+  python scripts/validate_plugins.py --list-rules   # Show rule ids, file kinds and cost classes
+  python scripts/validate_plugins.py --fast         # Cheap structural rules only (pre-commit)
+  python scripts/validate_plugins.py --skip-rules code-fences,frontmatter-yaml
+  python scripts/validate_plugins.py --max-file-size 1M  # Report larger files instead of reading them
 """
 
 import argparse
+import io
 import json
+import os
+import re
 import sys
+import time
 from pathlib import Path
 
 SCRIPT_DIR = Path(__file__).parent
 REPO_ROOT = SCRIPT_DIR.parent
 MARKETPLACE_JSON = REPO_ROOT / ".claude-plugin" / "marketplace.json"
 PLUGINS_DIR = REPO_ROOT / "plugins"
-REQUIRED_PLUGIN_FIELDS = ("name", "version", "description", "author")
+CACHE_FILE = REPO_ROOT / ".cache" / "validate_plugins.json"
+PROFILER = None  # set to a Profiler by --profile
+MAX_FILE_BYTES = 0  # --max-file-size; 0 (the default) disables the guard
+LARGE_FILE_BYTES = 1024 * 1024  # mmap and stream lines at or above this size
 SMART_PUNCTUATION = "“”‘’—"
 
 
@@ -44,6 +65,11 @@ class Finding:
             data["line"] = self.line
         return data
 
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data["severity"], data["check"], data["path"], data["message"],
+                   data.get("plugin"), data.get("line"))
+
 
 def rel(path):
     try:
@@ -67,22 +93,121 @@ def load_json(path, findings, check="Invalid JSON"):
     return None
 
 
-def read_text(path):
+def set_repo_root(root):
+    """Point the validator at another marketplace checkout (used by the benchmarks)."""
+    global REPO_ROOT, MARKETPLACE_JSON, PLUGINS_DIR, CACHE_FILE
+    REPO_ROOT = Path(root)
+    MARKETPLACE_JSON = REPO_ROOT / ".claude-plugin" / "marketplace.json"
+    PLUGINS_DIR = REPO_ROOT / "plugins"
+    CACHE_FILE = REPO_ROOT / ".cache" / "validate_plugins.json"
+
+
+def decode_text(data):
+    # One decode: "replace" is a no-op on valid UTF-8, so there is no need to
+    # try strict first. `data` may be bytes or an mmap; str() reads either.
+    text = str(data, "utf-8", "replace")
+    # Match Path.read_text() universal-newline behaviour.
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+class FileBytes:
+    """Context manager yielding a file's bytes, memory-mapped when it is large."""
+
+    def __init__(self, path, size=None):
+        self.path = path
+        self.size = size
+        self._file = None
+        self._map = None
+
+    def __enter__(self):
+        self._file = self.path.open("rb")
+        size = self.size if self.size is not None else os.fstat(self._file.fileno()).st_size
+        if size >= LARGE_FILE_BYTES:
+            try:
+                import mmap
+                self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+                return self._map
+            except (OSError, ValueError):
+                pass  # e.g. the file shrank to zero bytes; fall back to a plain read
+        return self._file.read()
+
+    def __exit__(self, *exc):
+        if self._map is not None:
+            self._map.close()
+        self._file.close()
+
+
+def read_text(path, size=None):
+    with FileBytes(path, size) as data:
+        return decode_text(data)
+
+
+def iter_lines(text):
+    # splitlines() is fastest but materialises every line at once; for large
+    # documents walk a StringIO instead. StringIO breaks only at "\n", so each
+    # piece goes through splitlines() too and both paths yield the same lines.
+    if len(text) < LARGE_FILE_BYTES:
+        return text.splitlines()
+    return (part for line in io.StringIO(text) for part in line.splitlines())
+
+
+def count_words(text):
+    if len(text) < LARGE_FILE_BYTES:
+        return len(text.split())
+    return sum(len(line.split()) for line in iter_lines(text))
+
+
+def oversized(size):
+    return MAX_FILE_BYTES and size > MAX_FILE_BYTES
+
+
+def format_size(size):
+    if size < 1024:
+        return f"{size} B"
+    if size < 1024 * 1024:
+        return f"{size / 1024:.1f} KiB"
+    return f"{size / (1024 * 1024):.1f} MiB"
+
+
+def parse_size(value):
+    """argparse type for --max-file-size: bytes, or a K/M/G suffix (binary units)."""
+    text = value.strip().upper().rstrip("B").rstrip("I")
+    scale = 1
+    if text and text[-1] in "KMG":
+        scale = 1024 ** ("KMG".index(text[-1]) + 1)
+        text = text[:-1]
     try:
-        return path.read_text(encoding="utf-8")
-    except UnicodeDecodeError:
-        return path.read_text(encoding="utf-8", errors="replace")
+        size = int(float(text) * scale)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid size: {value!r}")
+    if size < 0:
+        raise argparse.ArgumentTypeError("size must be >= 0")
+    return size
+
+
+def split_list(value):
+    """Comma-separated option value -> list of non-empty, stripped items."""
+    return [v.strip() for v in (value or "").split(",") if v.strip()]
 
 
 def frontmatter(text):
+    # Walk line by line up to the closing marker rather than splitting the
+    # whole document; the block is a few lines at the top of the file.
     if not text.startswith("---"):
         return None
-    lines = text.splitlines()
-    if not lines or lines[0].strip() != "---":
+    end = text.find("\n")
+    if end < 0 or text[:end].strip() != "---":
         return None
-    for i in range(1, len(lines)):
-        if lines[i].strip() == "---":
-            return "\n".join(lines[1:i])
+    body = start = end + 1
+    while start < len(text):
+        end = text.find("\n", start)
+        if end < 0:
+            end = len(text)
+        if text[start:end].strip() == "---":
+            return text[body:max(body, start - 1)]
+        start = end + 1
     return None
 
 
@@ -90,6 +215,11 @@ def parse_frontmatter(text):
     fm = frontmatter(text)
     if fm is None:
         return None
+    return parse_frontmatter_fields(fm)
+
+
+def parse_frontmatter_fields(fm):
+    # Line-oriented fallback for top-level scalars when YAML parsing fails.
     result = {}
     lines = fm.splitlines()
     i = 0
@@ -117,52 +247,150 @@ def parse_frontmatter(text):
     return result
 
 
-def validate_frontmatter(path, text, plugin, findings):
-    fm_text = frontmatter(text)
-    if fm_text is not None:
-        try:
-            import yaml
-            yaml.safe_load(fm_text)
-        except Exception as exc:
-            add(findings, "error", "Invalid YAML frontmatter", path,
-                f"YAML parsing failed: {exc}", plugin)
+_yaml = None
+
 
+def load_yaml(text):
+    global _yaml
+    if _yaml is None:
+        import yaml
+        _yaml = yaml
+    # libyaml's CSafeLoader is several times faster than the pure-Python
+    # SafeLoader and accepts the same documents.
+    fast_loader = getattr(_yaml, "CSafeLoader", None)
+    if fast_loader is not None:
+        try:
+            return _yaml.load(text, Loader=fast_loader)
+        except Exception:
+            # libyaml errors carry no source snippet; re-parse the (rare) broken
+            # document with the pure-Python loader for the detailed message.
+            pass
+    return _yaml.load(text, Loader=_yaml.SafeLoader)
+
+
+class Frontmatter:
+    """A document's frontmatter, parsed once and shared by every check."""
+
+    def __init__(self, text):
+        self.text = frontmatter(text)
+        self.data = None
+        self.error = None
+        self._fields = None
+        if self.text is not None:
+            try:
+                self.data = load_yaml(self.text)
+            except Exception as exc:
+                self.error = exc
+
+    @property
+    def present(self):
+        return self.text is not None
+
+    @property
+    def fields(self):
+        # The YAML mapping when it parsed, else the line parser's best effort.
+        if self._fields is None:
+            if isinstance(self.data, dict):
+                self._fields = self.data
+            else:
+                self._fields = parse_frontmatter_fields(self.text) if self.present else {}
+        return self._fields
+
+    def get_str(self, key):
+        value = self.fields.get(key)
+        if value is None:
+            return ""
+        return value if isinstance(value, str) else str(value)
+
+    def has_value(self, key, value):
+        if isinstance(self.data, dict):
+            return self.data.get(key) == value
+        if not self.present:
+            return False
+        # The YAML did not parse (and is reported as such): look for a
+        # `key: value` line, tolerating spacing, quotes and a trailing comment.
+        literal = str(value).lower() if isinstance(value, bool) else str(value)
+        for line in self.text.splitlines():
+            name, sep, rest = line.partition(":")
+            if sep and name.strip() == key:
+                if re.split(r"\s#", rest, 1)[0].strip().strip("\"'") == literal:
+                    return True
+        return False
+
+
+def validate_frontmatter(path, fm, plugin, findings):
+    if fm.error is not None:
+        add(findings, "error", "Invalid YAML frontmatter", path,
+            f"YAML parsing failed: {fm.error}", plugin)
 
 
 SUPPRESS_SMART_MARKER = "<!-- validator:allow-smart-punct -->"
 SUPPRESS_BARE_FENCE_MARKER = "<!-- validator:allow-bare-fence -->"
-# Pandoc-style fenced div opener (e.g. ::: {.callout-note}). Treat everything between
-# matching ::: lines as a non-code container so the fence state machine ignores
-# any ``` lines that the divs wrap.
-import re as _re_validator
+_FENCE_RES = None
+
+
+def fence_regexes():
+    """(heredoc, div open, div close, smart punctuation) patterns, compiled on first use.
+
+    Pandoc-style fenced div openers (e.g. ::: {.callout-note}) start a
+    non-code container, so the fence state machine ignores any ``` lines
+    between matching ::: lines. --fast and fence-free files never pay for these.
+    """
+    global _FENCE_RES
+    if _FENCE_RES is None:
+        _FENCE_RES = (
+            re.compile(r"<<-?\s*['\"]?([A-Za-z_][A-Za-z0-9_]*)['\"]?"),
+            re.compile(r"^:{3,}\s*\S"),
+            re.compile(r"^:{3,}\s*$"),
+            re.compile("[" + SMART_PUNCTUATION + "]"),
+        )
+    return _FENCE_RES
+
+
+class LineScan:
+    """What the per-file checks need from a document, gathered in one pass."""
 
-_HEREDOC_RE = _re_validator.compile(r"<<-?\s*['\"]?([A-Za-z_][A-Za-z0-9_]*)['\"]?")
-_PANDOC_DIV_OPEN_RE = _re_validator.compile(r"^:{3,}\s*\S")
-_PANDOC_DIV_CLOSE_RE = _re_validator.compile(r"^:{3,}\s*$")
+    def __init__(self, words, fence_issues):
+        self.words = words
+        self.fence_issues = fence_issues  # (check, message, line_no)
 
 
-def validate_code_fences(path, text, plugin, findings):
+def scan_lines(text):
+    # One walk over the lines tracks fence state, heredocs inside fences and
+    # Pandoc div depth, flags smart punctuation in code, and counts words
+    # (summing per-line splits equals len(text.split())).
+    #
     # File-level suppression markers. They must appear anywhere in the file's text;
     # use these for legitimate documentation of forbidden characters (e.g. a smart-punct
     # codepoint catalog) or for third-party content (e.g. Pandoc-formatted markdown).
-    suppress_smart = SUPPRESS_SMART_MARKER in text
+    issues = []
+    if "```" not in text:
+        # No fences at all: only the word count is needed.
+        return LineScan(count_words(text), issues)
+    heredoc_re, div_open_re, div_close_re, smart_re = fence_regexes()
+    smart_search = None if SUPPRESS_SMART_MARKER in text else smart_re.search
     suppress_bare_fence = SUPPRESS_BARE_FENCE_MARKER in text
 
+    words = 0
     inside = False
     opening_count = 0
     in_heredoc = False
     heredoc_terminator = ""
     pandoc_div_depth = 0
 
-    for line_no, line in enumerate(text.splitlines(), 1):
+    for line_no, line in enumerate(iter_lines(text), 1):
+        words += len(line.split())
+
         # Pandoc fenced divs (only meaningful outside a code fence).
         if not inside:
-            if _PANDOC_DIV_CLOSE_RE.match(line.rstrip()) and pandoc_div_depth > 0:
-                pandoc_div_depth -= 1
-                continue
-            if _PANDOC_DIV_OPEN_RE.match(line.rstrip()):
-                pandoc_div_depth += 1
-                continue
+            if line.startswith(":::"):
+                marker = line.rstrip()
+                if pandoc_div_depth > 0 and div_close_re.match(marker):
+                    pandoc_div_depth -= 1
+                    continue
+                if div_open_re.match(marker):
+                    pandoc_div_depth += 1
+                    continue
             if pandoc_div_depth > 0:
                 # Inside a Pandoc div container at the prose level. Ignore fences entirely;
                 # third-party content inside divs is not subject to our fence-language rule.
@@ -177,49 +405,44 @@ def validate_code_fences(path, text, plugin, findings):
 
         stripped = line.lstrip()
         if not stripped.startswith("```"):
-            # Detect heredoc OPEN inside a fenced code block so subsequent inner
-            # fences (commonly inside `cat <<'EOF' ... EOF` markdown payloads) are ignored.
             if inside:
-                m = _HEREDOC_RE.search(line)
-                if m:
-                    in_heredoc = True
-                    heredoc_terminator = m.group(1)
-                    continue
-            if inside and (not suppress_smart) and any(ch in line for ch in SMART_PUNCTUATION):
-                chars = "".join(ch for ch in SMART_PUNCTUATION if ch in line)
-                add(findings, "warning", "Smart punctuation in code", path,
-                    f"Smart punctuation inside fenced code block: {chars}", plugin, line_no)
-            continue
-
-        count = 0
-        for ch in stripped:
-            if ch == "`":
-                count += 1
-            else:
-                break
-        if count < 3:
+                # Detect heredoc OPEN inside a fenced code block so subsequent inner
+                # fences (commonly inside `cat <<'EOF' ... EOF` markdown payloads) are ignored.
+                if "<<" in line:
+                    m = heredoc_re.search(line)
+                    if m:
+                        in_heredoc = True
+                        heredoc_terminator = m.group(1)
+                        continue
+                if smart_search is not None and smart_search(line):
+                    issues.append(("Smart punctuation in code", smart_message(line), line_no))
             continue
 
-        rest = stripped[count:].strip()
+        count = len(stripped) - len(stripped.lstrip("`"))
         if not inside:
-            if rest == "" and not suppress_bare_fence:
-                add(findings, "warning", "Bare opening fence", path,
-                    "Outermost code fence has no language tag", plugin, line_no)
+            if not suppress_bare_fence and stripped[count:].strip() == "":
+                issues.append(("Bare opening fence", "Outermost code fence has no language tag", line_no))
             inside = True
             opening_count = count
         elif count >= opening_count:
             inside = False
             opening_count = 0
-        elif (not suppress_smart) and any(ch in line for ch in SMART_PUNCTUATION):
-            chars = "".join(ch for ch in SMART_PUNCTUATION if ch in line)
-            add(findings, "warning", "Smart punctuation in code", path,
-                f"Smart punctuation inside fenced code block: {chars}", plugin, line_no)
+        elif smart_search is not None and smart_search(line):
+            issues.append(("Smart punctuation in code", smart_message(line), line_no))
 
+    return LineScan(words, issues)
 
-def iter_files(root):
-    if not root.exists():
-        return []
-    return [p for p in root.rglob("*") if p.is_file()]
+
+def smart_message(line):
+    chars = "".join(ch for ch in SMART_PUNCTUATION if ch in line)
+    return f"Smart punctuation inside fenced code block: {chars}"
+
+
+def validate_code_fences(path, text, plugin, findings, scan=None):
+    if scan is None:
+        scan = scan_lines(text)
+    for check, message, line_no in scan.fence_issues:
+        add(findings, "warning", check, path, message, plugin, line_no)
 
 
 #
@@ -235,160 +458,894 @@ AGENT_OVER_TARGET_WORDS = 2500
 AGENT_OVERSIZED_WORDS = 3000
 
 
-def validate_agent(path, plugin, findings):
-    text = read_text(path)
-    validate_frontmatter(path, text, plugin, findings)
-    fm_text = frontmatter(text)
-    fm = parse_frontmatter(text) or {}
-    if fm_text is None or "model: inherit" not in fm_text:
-        add(findings, "error", "Agent missing model: inherit", path,
-            "Agent frontmatter must contain model: inherit", plugin)
-    if fm_text and any(line.strip() == "agent: true" for line in fm_text.splitlines()):
-        add(findings, "error", "Deprecated agent: true", path,
-            "Agent frontmatter contains legacy agent: true", plugin)
-    description = fm.get("description", "")
+class Rule:
+    def __init__(self, rule_id, kinds, cost, description, func):
+        self.rule_id = rule_id
+        self.kinds = kinds
+        self.cost = cost
+        self.description = description
+        self.func = func
+
+
+RULES = {}
+RULE_COSTS = ("cheap", "moderate", "expensive")
+FILE_KINDS = ("agent", "skill", "markdown")
+ACTIVE_RULES = None  # None runs every registered rule; otherwise a frozenset of rule ids
+
+
+def rule(rule_id, kinds, cost, description):
+    """Register a check. `kinds` are file kinds, or "plugin"/"tree" for
+    plugin.json and whole-tree checks. File rules run in registration order."""
+    def register(func):
+        RULES[rule_id] = Rule(rule_id, tuple(kinds), cost, description, func)
+        return func
+    return register
+
+
+def rule_enabled(rule_id):
+    return ACTIVE_RULES is None or rule_id in ACTIVE_RULES
+
+
+def select_rules(only=None, skip=None, fast=False):
+    unknown = sorted(set(only or ()).union(skip or ()) - set(RULES))
+    if unknown:
+        raise ValueError(f"unknown rule(s): {', '.join(unknown)}; see --list-rules")
+    ids = [r.rule_id for r in RULES.values() if not fast or r.cost == "cheap"]
+    if only:
+        ids = [r for r in ids if r in only]
+    if skip:
+        ids = [r for r in ids if r not in skip]
+    return frozenset(ids)
+
+
+class FileContext:
+    """Per-file inputs shared by the rules, each computed at most once."""
+
+    def __init__(self, path, plugin, findings, text):
+        self.path = path
+        self.plugin = plugin
+        self.findings = findings
+        self.text = text
+        self._fm = None
+        self._scan = None
+
+    @property
+    def fm(self):
+        if self._fm is None:
+            # Always parsed the same way, so --fast and --skip-rules see the
+            # same fields; frontmatter-yaml only decides whether a parse error
+            # is reported.
+            self._fm = profiled("validate_frontmatter", len(self.text), Frontmatter, self.text)
+        return self._fm
+
+    @property
+    def scan(self):
+        if self._scan is None:
+            self._scan = profiled("validate_code_fences", len(self.text), scan_lines, self.text)
+        return self._scan
+
+    @property
+    def words(self):
+        # The fence scan counts words as it goes; without it a plain split is cheaper.
+        if self._scan is not None or rule_enabled("code-fences"):
+            return self.scan.words
+        return count_words(self.text)
+
+    def add(self, severity, check, message, line=None):
+        add(self.findings, severity, check, self.path, message, self.plugin, line)
+
+
+@rule("frontmatter-yaml", FILE_KINDS, "expensive", "Frontmatter must parse as YAML")
+def check_frontmatter_yaml(ctx):
+    validate_frontmatter(ctx.path, ctx.fm, ctx.plugin, ctx.findings)
+
+
+@rule("agent-frontmatter", ("agent",), "cheap",
+      "Agents declare model: inherit, no agent: true, and a PROACTIVELY/Provides description")
+def check_agent_frontmatter(ctx):
+    fm = ctx.fm
+    if not fm.has_value("model", "inherit"):
+        ctx.add("error", "Agent missing model: inherit",
+                "Agent frontmatter must contain model: inherit")
+    if fm.has_value("agent", True):
+        ctx.add("error", "Deprecated agent: true",
+                "Agent frontmatter contains legacy agent: true")
+    description = fm.get_str("description")
     if len(description) > 1024:
-        add(findings, "error", "Agent description too long", path,
-            f"Agent description is {len(description)} characters; limit is 1024", plugin)
+        ctx.add("error", "Agent description too long",
+                f"Agent description is {len(description)} characters; limit is 1024")
     if description and "PROACTIVELY" not in description:
-        add(findings, "warning", "Agent missing PROACTIVELY", path,
-            "Agent frontmatter description should contain PROACTIVELY", plugin)
+        ctx.add("warning", "Agent missing PROACTIVELY",
+                "Agent frontmatter description should contain PROACTIVELY")
     if description and "Provides" not in description:
-        add(findings, "warning", "Agent missing Provides", path,
-            "Agent frontmatter description should contain Provides", plugin)
+        ctx.add("warning", "Agent missing Provides",
+                "Agent frontmatter description should contain Provides")
+
 
+@rule("agent-size", ("agent",), "moderate",
+      "Agent word-count ceiling and <example> blocks on fat agents")
+def check_agent_size(ctx):
     # Word count gates: lean orchestrators are exempt from the examples check
     # by design. Examples are expected only on fat agents above the target band.
-    words = len(text.split())
+    words = ctx.words
     if words > AGENT_OVERSIZED_WORDS:
-        add(findings, "warning", "Agent oversized", path,
-            f"Agent has {words} words; ceiling is {AGENT_OVERSIZED_WORDS}", plugin)
-    if words > AGENT_EXAMPLES_THRESHOLD_WORDS and "<example>" not in text:
-        add(findings, "warning", "Agent missing examples", path,
-            f"Agent has {words} words (>{AGENT_EXAMPLES_THRESHOLD_WORDS}); fat agents should contain at least one <example> block. Lean orchestrators under {AGENT_EXAMPLES_THRESHOLD_WORDS} words are exempt.",
-            plugin)
-    validate_code_fences(path, text, plugin, findings)
-
-
-def validate_skill(path, plugin, findings):
-    text = read_text(path)
-    validate_frontmatter(path, text, plugin, findings)
-    fm = parse_frontmatter(text)
-    words = len(text.split())
-    if fm is None:
-        add(findings, "error", "Skill missing frontmatter", path,
-            "SKILL.md must start with YAML frontmatter", plugin)
-    else:
-        description = fm.get("description", "")
-        if len(description) > 1024:
-            add(findings, "error", "Skill description too long", path,
-                f"Skill description is {len(description)} characters; limit is 1024", plugin)
-        if "PROACTIVELY" not in description:
-            add(findings, "warning", "Skill missing PROACTIVELY", path,
-                "Skill frontmatter description should contain PROACTIVELY", plugin)
-        if "Provides" not in description:
-            add(findings, "warning", "Skill missing Provides", path,
-                "Skill frontmatter description should contain Provides", plugin)
+        ctx.add("warning", "Agent oversized",
+                f"Agent has {words} words; ceiling is {AGENT_OVERSIZED_WORDS}")
+    if words > AGENT_EXAMPLES_THRESHOLD_WORDS and "<example>" not in ctx.text:
+        ctx.add("warning", "Agent missing examples",
+                f"Agent has {words} words (>{AGENT_EXAMPLES_THRESHOLD_WORDS}); fat agents should contain at least one <example> block. Lean orchestrators under {AGENT_EXAMPLES_THRESHOLD_WORDS} words are exempt.")
+
+
+@rule("skill-frontmatter", ("skill",), "cheap",
+      "SKILL.md has frontmatter with a PROACTIVELY/Provides description")
+def check_skill_frontmatter(ctx):
+    fm = ctx.fm
+    if not fm.present:
+        ctx.add("error", "Skill missing frontmatter",
+                "SKILL.md must start with YAML frontmatter")
+        return
+    description = fm.get_str("description")
+    if len(description) > 1024:
+        ctx.add("error", "Skill description too long",
+                f"Skill description is {len(description)} characters; limit is 1024")
+    if "PROACTIVELY" not in description:
+        ctx.add("warning", "Skill missing PROACTIVELY",
+                "Skill frontmatter description should contain PROACTIVELY")
+    if "Provides" not in description:
+        ctx.add("warning", "Skill missing Provides",
+                "Skill frontmatter description should contain Provides")
+
+
+@rule("skill-size", ("skill",), "moderate", "SKILL.md word-count target and limit")
+def check_skill_size(ctx):
+    words = ctx.words
     if words > 3000:
-        add(findings, "error", "Skill oversized", path,
-            f"SKILL.md has {words} words; limit is 3000", plugin)
+        ctx.add("error", "Skill oversized", f"SKILL.md has {words} words; limit is 3000")
     elif words > 2000:
-        add(findings, "warning", "Skill over target", path,
-            f"SKILL.md has {words} words; target is 2000", plugin)
-    validate_code_fences(path, text, plugin, findings)
+        ctx.add("warning", "Skill over target", f"SKILL.md has {words} words; target is 2000")
+
+
+@rule("code-fences", FILE_KINDS, "expensive",
+      "Outermost fences carry a language tag; no smart punctuation inside code")
+def check_code_fences(ctx):
+    validate_code_fences(ctx.path, ctx.text, ctx.plugin, ctx.findings, ctx.scan)
+
+
+def run_file_rules(kind, path, plugin, findings, text=None):
+    if text is None:
+        text = read_text(path)
+    ctx = FileContext(path, plugin, findings, text)
+    for r in RULES.values():
+        if kind in r.kinds and rule_enabled(r.rule_id):
+            r.func(ctx)
+
+
+def validate_agent(path, plugin, findings, text=None):
+    run_file_rules("agent", path, plugin, findings, text)
+
+
+def validate_skill(path, plugin, findings, text=None):
+    run_file_rules("skill", path, plugin, findings, text)
+
 
+def validate_markdown_file(path, plugin, findings, text=None):
+    run_file_rules("markdown", path, plugin, findings, text)
+
+
+FILE_VALIDATORS = {
+    "agent": validate_agent,
+    "skill": validate_skill,
+    "markdown": validate_markdown_file,
+}
+
+
+def validator_version():
+    # Any edit to this script invalidates every cached finding.
+    import hashlib
+    return hashlib.sha256(Path(__file__).read_bytes()).hexdigest()[:16]
+
+
+def rules_signature():
+    # Cached findings are only valid for the same set of file-level rules.
+    if ACTIVE_RULES is None:
+        return "all"
+    file_rules = [r.rule_id for r in RULES.values()
+                  if r.rule_id in ACTIVE_RULES and set(r.kinds) & set(FILE_KINDS)]
+    return ",".join(sorted(file_rules))
+
+
+class FindingCache:
+    """Per-file findings keyed by content hash, stored under .cache/.
+
+    Only single-file checks are cached; plugin.json, version, orphan and
+    registration checks always run fresh because they span files.
+    """
+
+    def __init__(self, path=None):
+        self.path = path or CACHE_FILE
+        self.version = validator_version()
+        self.rules = rules_signature()
+        self.entries = {}
+        self.updates = {}
+        self.seen = set()
+
+    def load(self):
+        try:
+            with self.path.open("r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return self
+        if isinstance(data, dict) and data.get("version") == self.version:
+            self.entries = data.get("files", {})
+        return self
+
+    def key(self, kind, plugin, data):
+        import hashlib
+        digest = hashlib.sha256(f"{kind}\0{plugin}\0".encode("utf-8"))
+        digest.update(data)
+        return digest.hexdigest()
+
+    def get(self, relpath, key=None, stat=None):
+        # With a (size, mtime_ns) stat from the file index an unchanged file is
+        # answered without reading it; otherwise the content hash must match.
+        self.seen.add(relpath)
+        entry = self.entries.get(relpath)
+        if entry is None or entry.get("rules") != self.rules:
+            return None
+        if key is not None:
+            if entry.get("key") != key:
+                return None
+        elif stat is None or entry.get("stat") != list(stat):
+            return None
+        return [Finding.from_dict(d) for d in entry["findings"]]
+
+    def put(self, relpath, key, findings, stat=None):
+        entry = {"key": key, "rules": self.rules, "findings": [f.to_dict() for f in findings]}
+        if stat is not None:
+            entry["stat"] = list(stat)
+        self.updates[relpath] = entry
+
+    def merge(self, updates, seen):
+        self.updates.update(updates)
+        self.seen.update(seen)
+
+    def save(self, prune=False):
+        if not self.updates and not prune:
+            return
+        files = {k: v for k, v in self.entries.items() if not prune or k in self.seen}
+        files.update(self.updates)
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix(".tmp")
+            with tmp.open("w", encoding="utf-8") as f:
+                json.dump({"version": self.version, "files": files}, f, separators=(",", ":"))
+            os.replace(tmp, self.path)
+        except OSError:
+            pass  # The cache is an optimisation; a read-only checkout still validates.
+
+
+def run_file_validator(kind, path, plugin, findings, text=None, size=0):
+    validator = FILE_VALIDATORS[kind]
+    if PROFILER is None:
+        validator(path, plugin, findings, text)
+        return
+    start = time.perf_counter()
+    validator(path, plugin, findings, text)
+    PROFILER.record(validator.__name__, time.perf_counter() - start, size, rel(path), plugin)
+
+
+def kind_has_rules(kind):
+    return any(kind in r.kinds and rule_enabled(r.rule_id) for r in RULES.values())
+
+
+def validate_file(kind, path, plugin, findings, cache=None, stat=None):
+    if ACTIVE_RULES is not None and not kind_has_rules(kind):
+        return  # e.g. stray markdown under --fast: nothing to check, so do not read it
+    size = stat[0] if stat is not None else path.stat().st_size
+    if oversized(size):
+        # Generated dumps can be hundreds of MB; report them instead of reading.
+        add(findings, "warning", "File too large", path,
+            f"Skipped: {format_size(size)} exceeds --max-file-size {format_size(MAX_FILE_BYTES)}", plugin)
+        return
+    if cache is None:
+        run_file_validator(kind, path, plugin, findings, size=size)
+        return
+    start = time.perf_counter() if PROFILER is not None else 0
+    relpath = rel(path)
+    cached = cache.get(relpath, stat=stat) if stat is not None else None
+    if cached is None:
+        with FileBytes(path, size) as data:
+            key = cache.key(kind, plugin, data)
+            cached = cache.get(relpath, key)
+            text = decode_text(data) if cached is None else None
+        if cached is None:
+            file_findings = []
+            run_file_validator(kind, path, plugin, file_findings, text, size)
+            cache.put(relpath, key, file_findings, stat)
+            findings.extend(file_findings)
+            return
+        cache.put(relpath, key, cached, stat)
+    if PROFILER is not None:
+        PROFILER.record("cache hit", time.perf_counter() - start, 0, relpath, plugin)
+    findings.extend(cached)
+
+
+KIND_ORDER = {"agent": 0, "skill": 1, "markdown": 2}
+
+
+def file_kind(parts):
+    # `parts` is a path relative to the plugin directory. Any .md under agents/
+    # is an agent, any SKILL.md under skills/ is a skill, the rest is markdown.
+    if not parts or not parts[-1].endswith(".md"):
+        return None
+    if parts[0] == "agents" and len(parts) > 1:
+        return "agent"
+    if parts[0] == "skills" and parts[-1] == "SKILL.md":
+        return "skill"
+    return "markdown"
+
+
+class FileEntry:
+    def __init__(self, parts, size, mtime):
+        self.parts = parts  # relative to PLUGINS_DIR; parts[0] is the plugin directory
+        self.path = PLUGINS_DIR.joinpath(*parts)
+        self.relpath = rel(self.path)
+        self.plugin = parts[0] if len(parts) > 1 else None
+        self.kind = file_kind(parts[1:]) if self.plugin else None
+        self.size = size
+        self.mtime = mtime
+
+    @property
+    def stat(self):
+        return (self.size, self.mtime)
+
+
+class FileIndex:
+    """Every file under plugins/, gathered once and shared by all checks."""
+
+    def __init__(self):
+        self.files = []
+        self.plugin_dirs = []
+        self.by_plugin = {}
+
+    def add(self, parts, size, mtime):
+        entry = FileEntry(parts, size, mtime)
+        self.files.append(entry)
+        if entry.plugin:
+            self.by_plugin.setdefault(entry.plugin, []).append(entry)
+
+    def finish(self):
+        # Sort on path parts so the order matches sorted(Path.glob(...)).
+        self.files.sort(key=lambda e: e.parts)
+        self.plugin_dirs.sort()
+        for entries in self.by_plugin.values():
+            entries.sort(key=lambda e: (KIND_ORDER.get(e.kind, 3), e.parts))
+        return self
+
+    @classmethod
+    def scan(cls, names=None):
+        # One os.scandir() walk; DirEntry caches the type bits, so no extra
+        # stat() or resolve() per file beyond the size/mtime we keep. `names`
+        # limits the walk to those plugin directories.
+        index = cls()
+        if not PLUGINS_DIR.is_dir():
+            return index.finish()
+        stack = [(str(PLUGINS_DIR), ())]
+        while stack:
+            dirpath, prefix = stack.pop()
+            try:
+                entries = os.scandir(dirpath)
+            except OSError:
+                continue
+            with entries:
+                for entry in entries:
+                    parts = prefix + (entry.name,)
+                    try:
+                        if entry.is_dir():
+                            if not prefix:
+                                index.plugin_dirs.append(entry.name)
+                                if names is not None and entry.name not in names:
+                                    continue
+                            # Like Path.rglob(), do not descend into symlinked directories.
+                            if not prefix or not entry.is_symlink():
+                                stack.append((entry.path, parts))
+                        elif entry.is_file() and (names is None or prefix):
+                            st = entry.stat()
+                            index.add(parts, st.st_size, st.st_mtime_ns)
+                    except OSError:
+                        continue
+        return index.finish()
+
+    @classmethod
+    def from_paths(cls, relpaths):
+        # Index only the given repo-relative paths (changed-since mode).
+        index = cls()
+        prefix = rel(PLUGINS_DIR) + "/"
+        for relpath in relpaths:
+            if not relpath.startswith(prefix):
+                continue
+            try:
+                st = (REPO_ROOT / relpath).stat()
+            except OSError:
+                continue  # deleted in the diff
+            index.add(tuple(relpath[len(prefix):].split("/")), st.st_size, st.st_mtime_ns)
+        if PLUGINS_DIR.is_dir():
+            index.plugin_dirs = [p.name for p in PLUGINS_DIR.iterdir() if p.is_dir()]
+        return index.finish()
+
+    def plugin_files(self, name):
+        return [e for e in self.by_plugin.get(name, ()) if e.kind]
+
+
+class ChangedSinceError(Exception):
+    """git could not list the files changed since a --changed-since ref."""
+
+
+def changed_paths(ref):
+    """Return repo-relative paths changed since `ref`, including untracked files."""
+    import subprocess
+    commands = (
+        ["git", "diff", "--name-only", "--relative", ref, "--"],
+        ["git", "ls-files", "--others", "--exclude-standard"],
+    )
+    changed = set()
+    for cmd in commands:
+        try:
+            result = subprocess.run(cmd, cwd=REPO_ROOT, capture_output=True, text=True)
+        except OSError as exc:
+            raise ChangedSinceError(f"cannot run git: {exc}") from exc
+        if result.returncode != 0:
+            raise ChangedSinceError(result.stderr.strip() or f"{' '.join(cmd)} failed")
+        changed.update(line for line in result.stdout.splitlines() if line)
+    return changed
 
-def validate_markdown_file(path, plugin, findings):
-    text = read_text(path)
-    validate_frontmatter(path, text, plugin, findings)
-    validate_code_fences(path, text, plugin, findings)
 
+def validate_plugin_manifest(entry, findings):
+    """Check plugins/<name>/.claude-plugin/plugin.json against the marketplace entry.
 
-def validate_plugin(entry, findings):
+    Returns False when the plugin's files should not be validated.
+    """
     name = entry.get("name", "<missing-name>")
     plugin_dir = PLUGINS_DIR / name
     if not plugin_dir.is_dir():
         add(findings, "error", "Missing plugin directory", plugin_dir,
             f"Registered plugin has no plugins/{name}/ directory", name)
-        return
+        return False
 
     plugin_json = plugin_dir / ".claude-plugin" / "plugin.json"
     if not plugin_json.exists():
         add(findings, "error", "Missing plugin.json", plugin_json,
             "Plugin is missing .claude-plugin/plugin.json", name)
-        return
+        return False
 
     data = load_json(plugin_json, findings)
     if not isinstance(data, dict):
-        return
+        return False
+    if rule_enabled("plugin-manifest"):
+        check_plugin_manifest(entry, data, plugin_json, findings)
+    return True
+
+
+@rule("plugin-manifest", ("plugin",), "cheap",
+      "plugin.json matches scripts/schemas/plugin.schema.json and its marketplace entry")
+def check_plugin_manifest(entry, data, plugin_json, findings):
+    from manifest_schema import format_error, load_validator
 
-    for field in REQUIRED_PLUGIN_FIELDS:
-        if field not in data:
+    name = entry.get("name", "<missing-name>")
+    for error in load_validator("plugin")(data):
+        if error.keyword == "required" and error.pointer.count("/") == 1:
             add(findings, "error", "Missing required fields", plugin_json,
-                f"plugin.json missing required field: {field}", name)
+                f"plugin.json {error.message}", name)
+        elif error.keyword == "maxLength" and error.pointer == "/description":
+            add(findings, "error", "Description too long", plugin_json,
+                f"plugin.json description {error.message}", name)
+        else:
+            add(findings, "error", "Invalid plugin.json", plugin_json,
+                f"plugin.json {format_error(error)}", name)
+    # Cross-document checks; the schema only sees one file at a time.
     if data.get("name") != name:
         add(findings, "error", "Name mismatch", plugin_json,
             f"plugin.json name {data.get('name')!r} != marketplace name {name!r}", name)
     if entry.get("version") != data.get("version"):
         add(findings, "error", "Version mismatch", plugin_json,
             f"marketplace version {entry.get('version')!r} != plugin.json version {data.get('version')!r}", name)
-    description = data.get("description", "")
-    if isinstance(description, str) and len(description) > 1024:
-        add(findings, "error", "Description too long", plugin_json,
-            f"plugin.json description is {len(description)} characters; limit is 1024", name)
-
-    for agent in sorted((plugin_dir / "agents").glob("**/*.md")):
-        validate_agent(agent, name, findings)
-    for skill in sorted((plugin_dir / "skills").glob("**/SKILL.md")):
-        validate_skill(skill, name, findings)
-
-    handled = {p.resolve() for p in (plugin_dir / "agents").glob("**/*.md")}
-    handled.update(p.resolve() for p in (plugin_dir / "skills").glob("**/SKILL.md"))
-    for md in sorted(plugin_dir.glob("**/*.md")):
-        if md.resolve() not in handled:
-            validate_markdown_file(md, name, findings)
-
-
-def validate_orphans_and_dirs(registered, findings):
-    if PLUGINS_DIR.exists():
-        for path in iter_files(PLUGINS_DIR):
-            if path.suffix in (".bak", ".tmp", ".draft"):
-                add(findings, "error", "Orphan working files", path,
-                    "Working file extension found under plugins/")
-        for child in sorted(p for p in PLUGINS_DIR.iterdir() if p.is_dir()):
-            if child.name.startswith("."):
-                continue
-            if child.name not in registered:
-                add(findings, "warning", "Unregistered plugin directory", child,
-                    "Directory under plugins/ is not registered in marketplace.json", child.name)
 
 
-def run_validation(plugin_name=None):
+def validate_plugin(entry, findings, cache=None, index=None):
+    start = time.perf_counter() if PROFILER is not None else 0
+    name = entry.get("name", "<missing-name>")
+    if validate_plugin_manifest(entry, findings):
+        if index is None:
+            index = FileIndex.scan([name])
+        for f in index.plugin_files(name):
+            validate_file(f.kind, f.path, name, findings, cache, f.stat)
+    if PROFILER is not None:
+        size = sum(f.size for f in index.plugin_files(name)) if index is not None else 0
+        PROFILER.record("plugin", time.perf_counter() - start, size, name, name)
+
+
+_worker_cache = None
+
+
+def init_worker(use_cache, profile=False, rules=None, root=None, max_bytes=None):
+    global _worker_cache, PROFILER, ACTIVE_RULES, MAX_FILE_BYTES
+    if root is not None:
+        set_repo_root(root)  # spawn-based pools re-import the module with the default root
+    # Each task brings the one cache entry it needs, so the worker's cache
+    # starts empty and is never loaded from or saved to disk.
+    _worker_cache = FindingCache() if use_cache else None
+    PROFILER = Profiler() if profile else None
+    ACTIVE_RULES = rules
+    if max_bytes is not None:
+        MAX_FILE_BYTES = max_bytes
+
+
+def validate_file_task(task):
+    # Process-pool entry point: findings and cache updates are returned rather
+    # than appended so the parent can merge them back in marketplace order.
+    kind, path, relpath, plugin, stat, entry = task
     findings = []
+    cache = _worker_cache
+    if cache is not None:
+        cache.entries = {relpath: entry} if entry is not None else {}
+        cache.updates, cache.seen = {}, set()
+    if PROFILER is not None:
+        PROFILER.records = []
+    start = time.perf_counter()
+    validate_file(kind, path, plugin, findings, cache, stat)
+    elapsed = time.perf_counter() - start
+    records = PROFILER.records if PROFILER is not None else []
+    updates = cache.updates if cache is not None else {}
+    return findings, updates, records, elapsed
+
+
+def validate_plugins(selected, findings, jobs=1, cache=None, index=None):
+    """Validate each selected plugin; with jobs > 1, files are spread over a process pool.
+
+    Work is split per file rather than per plugin, so one very large plugin
+    still uses every worker. plugin.json checks and cache hits answered from
+    the file index's stat run in the parent; only files that must be read
+    are sent to workers, each with its own cache entry.
+    """
+    if jobs == 0:
+        jobs = os.cpu_count() or 1
+    if jobs <= 1:
+        for entry in selected:
+            validate_plugin(entry, findings, cache, index)
+        return
+
+    if index is None:
+        index = FileIndex.scan([p.get("name", "<missing-name>") for p in selected])
+    plan = []   # (plugin name, manifest findings, manifest seconds, [slot per file])
+    tasks = []
+    for entry in selected:
+        name = entry.get("name", "<missing-name>")
+        start = time.perf_counter()
+        manifest_findings = []
+        slots = []
+        if validate_plugin_manifest(entry, manifest_findings):
+            for f in index.plugin_files(name):
+                cached = cache.get(f.relpath, stat=f.stat) if cache is not None else None
+                if cached is not None:
+                    if PROFILER is not None:
+                        PROFILER.record("cache hit", 0, 0, f.relpath, name)
+                    slots.append(cached)
+                    continue
+                entry_for_file = cache.entries.get(f.relpath) if cache is not None else None
+                slots.append(len(tasks))
+                tasks.append((f.kind, f.path, f.relpath, name, f.stat, entry_for_file))
+        plan.append((name, manifest_findings, time.perf_counter() - start, slots))
+
+    results = []
+    if tasks:
+        from concurrent.futures import ProcessPoolExecutor
+        workers = min(jobs, len(tasks))
+        with ProcessPoolExecutor(max_workers=workers, initializer=init_worker,
+                                 initargs=(cache is not None, PROFILER is not None, ACTIVE_RULES,
+                                           REPO_ROOT, MAX_FILE_BYTES)) as pool:
+            # map() yields in submission order, so output is identical to a serial run.
+            results = list(pool.map(validate_file_task, tasks,
+                                    chunksize=max(1, len(tasks) // (workers * 4))))
+
+    for name, manifest_findings, seconds, slots in plan:
+        findings.extend(manifest_findings)
+        for slot in slots:
+            if not isinstance(slot, int):
+                findings.extend(slot)  # cache hit answered in the parent
+                continue
+            file_findings, updates, records, elapsed = results[slot]
+            findings.extend(file_findings)
+            seconds += elapsed
+            if cache is not None:
+                cache.merge(updates, {tasks[slot][2]})
+            if PROFILER is not None:
+                PROFILER.records.extend(records)
+        if PROFILER is not None:
+            size = sum(f.size for f in index.plugin_files(name))
+            PROFILER.record("plugin", seconds, size, name, name)
+
+
+def validate_orphans_and_dirs(registered, findings, index):
+    if rule_enabled("orphan-files"):
+        check_orphan_files(index, findings)
+    if rule_enabled("unregistered-dirs"):
+        check_unregistered_dirs(registered, index, findings)
+
+
+@rule("orphan-files", ("tree",), "cheap", "No .bak/.tmp/.draft working files under plugins/")
+def check_orphan_files(index, findings):
+    for f in index.files:
+        if f.path.suffix in (".bak", ".tmp", ".draft"):
+            add(findings, "error", "Orphan working files", f.path,
+                "Working file extension found under plugins/")
+
+
+@rule("unregistered-dirs", ("tree",), "cheap", "Every plugins/ directory is registered in marketplace.json")
+def check_unregistered_dirs(registered, index, findings):
+    for name in index.plugin_dirs:
+        if name.startswith("."):
+            continue
+        if name not in registered:
+            add(findings, "warning", "Unregistered plugin directory", PLUGINS_DIR / name,
+                "Directory under plugins/ is not registered in marketplace.json", name)
+
+
+@rule("marketplace-schema", ("tree",), "cheap",
+      "marketplace.json matches scripts/schemas/marketplace.schema.json")
+def check_marketplace_schema(marketplace, findings, plugin_name=None):
+    from manifest_schema import format_error, load_validator
+
+    plugins = marketplace.get("plugins")
+    for error in load_validator("marketplace")(marketplace):
+        plugin = None
+        if error.pointer.startswith("/plugins/"):
+            entry = plugins[int(error.pointer.split("/")[2])]
+            if isinstance(entry, dict) and isinstance(entry.get("name"), str):
+                plugin = entry["name"]
+            if plugin_name and plugin != plugin_name:
+                continue  # --plugin: another entry's problem
+        add(findings, "error", "Invalid marketplace.json", MARKETPLACE_JSON,
+            f"marketplace.json {format_error(error)}", plugin)
+
+
+def load_marketplace_plugins(findings, plugin_name=None):
     marketplace = load_json(MARKETPLACE_JSON, findings)
     if not isinstance(marketplace, dict):
-        return findings, []
+        return None
     plugins = marketplace.get("plugins", [])
     if not isinstance(plugins, list):
         add(findings, "error", "Invalid JSON", MARKETPLACE_JSON,
             "marketplace.json plugins field must be an array")
+        return None
+    if rule_enabled("marketplace-schema"):
+        check_marketplace_schema(marketplace, findings, plugin_name)
+    return plugins
+
+
+def select_plugins(plugins, plugin_name, findings):
+    if not plugin_name:
+        return [p for p in plugins if isinstance(p, dict)]
+    selected = [p for p in plugins if isinstance(p, dict) and p.get("name") == plugin_name]
+    if not selected:
+        add(findings, "error", "Missing plugin directory", PLUGINS_DIR / plugin_name,
+            f"Plugin {plugin_name!r} is not registered in marketplace.json", plugin_name)
+    return selected
+
+
+class Profiler:
+    """Wall time and input size per check, per file and per plugin (--profile).
+
+    Each record is (check, seconds, size, target, plugin). File checks count
+    the bytes read; frontmatter and fence checks count characters scanned.
+    """
+
+    FILE_CHECKS = ("validate_agent", "validate_skill", "validate_markdown_file")
+
+    def __init__(self):
+        self.records = []
+        self.started = time.perf_counter()
+        self.wall = None
+
+    def record(self, check, seconds, size=0, target=None, plugin=None):
+        self.records.append((check, seconds, size, target, plugin))
+
+    def stop(self):
+        self.wall = time.perf_counter() - self.started
+
+    def checks(self):
+        totals = {}
+        for check, seconds, size, _, _ in self.records:
+            if check == "plugin":
+                continue
+            t = totals.setdefault(check, {"check": check, "calls": 0, "seconds": 0.0, "bytes": 0})
+            t["calls"] += 1
+            t["seconds"] += seconds
+            t["bytes"] += size
+        return sorted(totals.values(), key=lambda t: -t["seconds"])
+
+    def slowest(self, checks, top):
+        rows = [{"check": check, "target": target, "plugin": plugin,
+                 "seconds": seconds, "bytes": size}
+                for check, seconds, size, target, plugin in self.records if check in checks]
+        return sorted(rows, key=lambda r: -r["seconds"])[:top]
+
+    def to_dict(self, top):
+        return {
+            "wall_seconds": self.wall,
+            "checks": self.checks(),
+            "slowest_plugins": self.slowest(("plugin",), top),
+            "slowest_files": self.slowest(self.FILE_CHECKS, top),
+        }
+
+    def print_report(self, top, out=None):
+        out = out or sys.stderr
+        report = self.to_dict(top)
+        print(f"\n=== Validation Profile (wall {report['wall_seconds'] * 1000:.1f} ms) ===", file=out)
+        print(f"{'CHECK':<26} {'CALLS':>7} {'TOTAL MS':>10} {'KB':>10}", file=out)
+        print("-" * 56, file=out)
+        for t in report["checks"]:
+            print(f"{t['check']:<26} {t['calls']:>7} {t['seconds'] * 1000:>10.1f} {t['bytes'] / 1024:>10.1f}", file=out)
+        for title, rows in (("plugins", report["slowest_plugins"]), ("files", report["slowest_files"])):
+            if not rows:
+                continue
+            print(f"\nTop {len(rows)} slowest {title}:", file=out)
+            for r in rows:
+                print(f"{r['seconds'] * 1000:>9.1f} ms {r['bytes'] / 1024:>9.1f} KB  {r['target']}", file=out)
+
+
+def profiled(check, size, func, *args):
+    if PROFILER is None:
+        return func(*args)
+    start = time.perf_counter()
+    try:
+        return func(*args)
+    finally:
+        PROFILER.record(check, time.perf_counter() - start, size)
+
+
+def run_validation(plugin_name=None, jobs=1, use_cache=True, changed_since=None, writer=None):
+    findings = FindingStream(writer) if writer is not None else []
+    plugins = load_marketplace_plugins(findings, plugin_name)
+    if plugins is None:
         return findings, []
 
     registered = {p.get("name") for p in plugins if isinstance(p, dict) and p.get("name")}
-    if plugin_name:
-        selected = [p for p in plugins if isinstance(p, dict) and p.get("name") == plugin_name]
-        if not selected:
-            add(findings, "error", "Missing plugin directory", PLUGINS_DIR / plugin_name,
-                f"Plugin {plugin_name!r} is not registered in marketplace.json", plugin_name)
+    # In changed-since mode every registered plugin still gets its cheap
+    # plugin.json checks; only the per-file scans are limited to the diff.
+    if changed_since:
+        index = profiled("index scan", 0, FileIndex.from_paths, changed_paths(changed_since))
     else:
-        selected = [p for p in plugins if isinstance(p, dict)]
-        validate_orphans_and_dirs(registered, findings)
-
-    for entry in selected:
-        validate_plugin(entry, findings)
+        index = profiled("index scan", 0, FileIndex.scan, [plugin_name] if plugin_name else None)
+    selected = select_plugins(plugins, plugin_name, findings)
+    if not plugin_name:
+        profiled("orphan scan", 0, validate_orphans_and_dirs, registered, findings, index)
+
+    cache = FindingCache().load() if use_cache else None
+    validate_plugins(selected, findings, jobs, cache, index)
+    if cache is not None:
+        # Only a full run has seen every file, so only it may drop stale entries.
+        cache.save(prune=not plugin_name and not changed_since)
     return findings, selected
 
 
+class FindingStream(list):
+    # A findings list that forwards every finding to a writer as it is added,
+    # so checks keep appending to a plain list while output streams.
+    def __init__(self, writer):
+        super().__init__()
+        self.writer = writer
+
+    def append(self, finding):
+        super().append(finding)
+        self.writer.write(finding)
+
+    def extend(self, findings):
+        for finding in findings:
+            self.append(finding)
+
+
+def summarize(findings, selected, strict):
+    errors = sum(1 for f in findings if f.severity == "error")
+    warnings = sum(1 for f in findings if f.severity == "warning")
+    return {
+        "plugins_checked": len(selected),
+        "errors": errors,
+        "warnings": warnings,
+        "strict": strict,
+        "passed": errors == 0 and (warnings == 0 or not strict),
+    }
+
+
+class FindingWriter:
+    """Output sink: write() sees each finding as it is produced, close() runs once at the end."""
+
+    def __init__(self, strict, out=None):
+        self.strict = strict
+        self.out = out or sys.stdout
+        self.findings = []
+
+    def write(self, finding):
+        self.findings.append(finding)
+
+    def close(self, selected):
+        """Flush whatever the format buffers; writers that stream as they go need nothing here."""
+
+
+class HumanWriter(FindingWriter):
+    def close(self, selected):
+        print_human(self.findings, selected, self.strict)
+
+
+class JsonWriter(FindingWriter):
+    def close(self, selected):
+        print_json(self.findings, selected, self.strict)
+
+
+class NdjsonWriter(FindingWriter):
+    # One finding object per line, flushed immediately, then a final
+    # {"summary": {...}} line once validation completes.
+    def write(self, finding):
+        super().write(finding)
+        self.out.write(json.dumps(finding.to_dict(), ensure_ascii=False) + "\n")
+        self.out.flush()
+
+    def close(self, selected):
+        self.out.write(json.dumps({"summary": summarize(self.findings, selected, self.strict)}) + "\n")
+        self.out.flush()
+
+
+class SarifWriter(FindingWriter):
+    SCHEMA = "https://json.schemastore.org/sarif-2.1.0.json"
+
+    @staticmethod
+    def rule_id(check):
+        return "-".join("".join(ch if ch.isalnum() else " " for ch in check.lower()).split())
+
+    def close(self, selected):
+        rules = {}
+        rule_index = {}
+        results = []
+        for f in self.findings:
+            rule_id = self.rule_id(f.check)
+            if rule_id not in rules:
+                rules[rule_id] = {"id": rule_id, "name": f.check,
+                                  "shortDescription": {"text": f.check}}
+                rule_index[rule_id] = len(rule_index)
+            location = {"artifactLocation": {"uri": f.path, "uriBaseId": "%SRCROOT%"}}
+            if f.line is not None:
+                location["region"] = {"startLine": f.line}
+            results.append({
+                "ruleId": rule_id,
+                "ruleIndex": rule_index[rule_id],
+                "level": "error" if f.severity == "error" else "warning",
+                "message": {"text": f.message},
+                "locations": [{"physicalLocation": location}],
+            })
+        json.dump({
+            "$schema": self.SCHEMA,
+            "version": "2.1.0",
+            "runs": [{
+                "tool": {"driver": {
+                    "name": "validate_plugins",
+                    "informationUri": "https://docs.claude.com/en/docs/claude-code/plugins",
+                    "rules": list(rules.values()),
+                }},
+                "originalUriBaseIds": {"%SRCROOT%": {"uri": REPO_ROOT.resolve().as_uri() + "/"}},
+                "results": results,
+                "properties": {"summary": summarize(self.findings, selected, self.strict)},
+            }],
+        }, self.out, indent=2, ensure_ascii=False)
+        self.out.write("\n")
+
+
+WRITERS = {
+    "human": HumanWriter,
+    "json": JsonWriter,
+    "ndjson": NdjsonWriter,
+    "sarif": SarifWriter,
+}
+
+
 def print_human(findings, selected, strict):
     errors = [f for f in findings if f.severity == "error"]
     warnings = [f for f in findings if f.severity == "warning"]
@@ -403,38 +1360,457 @@ def print_human(findings, selected, strict):
     print("\nSEVERITY  CHECK                         PATH                                          MESSAGE")
     print("-" * 120)
     for f in findings:
-        line = f":{f.line}" if f.line is not None else ""
-        path = (f.path + line)[:44]
-        print(f"{f.severity.upper():<9} {f.check[:28]:<29} {path:<45} {f.message}")
+        print(format_row(f))
+
+
+def format_row(f):
+    line = f":{f.line}" if f.line is not None else ""
+    path = (f.path + line)[:44]
+    return f"{f.severity.upper():<9} {f.check[:28]:<29} {path:<45} {f.message}"
 
 
 def print_json(findings, selected, strict):
-    errors = sum(1 for f in findings if f.severity == "error")
-    warnings = sum(1 for f in findings if f.severity == "warning")
     print(json.dumps({
-        "summary": {
-            "plugins_checked": len(selected),
-            "errors": errors,
-            "warnings": warnings,
-            "strict": strict,
-            "passed": errors == 0 and (warnings == 0 or not strict),
-        },
+        "summary": summarize(findings, selected, strict),
         "findings": [f.to_dict() for f in findings],
     }, indent=2))
 
 
+def finding_key(f):
+    return (f.path, f.line or 0, f.severity, f.check, f.message)
+
+
+class Watcher:
+    """Polls plugins/ and marketplace.json, revalidating only what changed.
+
+    The marketplace checks, plugin.json checks and file index are cheap and
+    are redone on every change; agent/skill/markdown findings are kept
+    resident per file and recomputed only for files whose size or mtime
+    moved (or whose plugin just became checkable).
+    """
+
+    def __init__(self, plugin_name=None, strict=False, interval=0.5):
+        self.plugin_name = plugin_name
+        self.strict = strict
+        self.interval = interval
+        self.index = None
+        self.marketplace_stat = None
+        self.selected = []
+        self.global_findings = []
+        self.manifest_findings = {}
+        self.checked_plugins = set()
+        self.file_findings = {}
+
+    def stat_marketplace(self):
+        try:
+            st = MARKETPLACE_JSON.stat()
+        except OSError:
+            return None
+        return (st.st_size, st.st_mtime_ns)
+
+    def refresh(self):
+        """Revalidate whatever changed since the last call; return the touched paths."""
+        index = FileIndex.scan([self.plugin_name] if self.plugin_name else None)
+        marketplace_stat = self.stat_marketplace()
+        old = {f.relpath: f.stat for f in self.index.files} if self.index else {}
+        new = {f.relpath: f for f in index.files}
+        touched = {r for r, f in new.items() if old.get(r) != f.stat}
+        touched.update(r for r in old if r not in new)
+        if self.index is not None and not touched and marketplace_stat == self.marketplace_stat:
+            return set()
+        if marketplace_stat != self.marketplace_stat:
+            touched.add(rel(MARKETPLACE_JSON))
+        self.index = index
+        self.marketplace_stat = marketplace_stat
+
+        findings = []
+        plugins = load_marketplace_plugins(findings, self.plugin_name)
+        self.selected = []
+        self.manifest_findings = {}
+        self.checked_plugins = set()
+        if plugins is not None:
+            registered = {p.get("name") for p in plugins if isinstance(p, dict) and p.get("name")}
+            self.selected = select_plugins(plugins, self.plugin_name, findings)
+            if not self.plugin_name:
+                validate_orphans_and_dirs(registered, findings, index)
+            for entry in self.selected:
+                name = entry.get("name", "<missing-name>")
+                plugin_findings = self.manifest_findings.setdefault(name, [])
+                if validate_plugin_manifest(entry, plugin_findings):
+                    self.checked_plugins.add(name)
+        self.global_findings = findings
+
+        for relpath in [r for r in self.file_findings if r not in new]:
+            del self.file_findings[relpath]
+        for name in self.checked_plugins:
+            for f in index.plugin_files(name):
+                if f.relpath in touched or f.relpath not in self.file_findings:
+                    file_findings = []
+                    validate_file(f.kind, f.path, name, file_findings)
+                    self.file_findings[f.relpath] = file_findings
+        return touched
+
+    def findings(self):
+        # Same order as run_validation(): global checks, then per plugin.
+        result = list(self.global_findings)
+        for entry in self.selected:
+            name = entry.get("name", "<missing-name>")
+            result.extend(self.manifest_findings.get(name, ()))
+            if name in self.checked_plugins:
+                for f in self.index.plugin_files(name):
+                    result.extend(self.file_findings.get(f.relpath, ()))
+        return result
+
+    def report(self, before, after, touched, elapsed):
+        remaining = {}
+        for f in before:
+            remaining.setdefault(finding_key(f), []).append(f)
+        added = []
+        for f in after:
+            bucket = remaining.get(finding_key(f))
+            if bucket:
+                bucket.pop()
+            else:
+                added.append(f)
+        removed = [f for bucket in remaining.values() for f in bucket]
+        errors = sum(1 for f in after if f.severity == "error")
+        warnings = sum(1 for f in after if f.severity == "warning")
+        print(f"[{time.strftime('%H:%M:%S')}] {len(touched)} path(s) changed, "
+              f"revalidated in {elapsed * 1000:.0f} ms: +{len(added)} -{len(removed)} "
+              f"(errors: {errors}, warnings: {warnings})")
+        for f in removed:
+            print("- " + format_row(f))
+        for f in added:
+            print("+ " + format_row(f))
+        sys.stdout.flush()
+
+    def run(self):
+        self.refresh()
+        current = self.findings()
+        print_human(current, self.selected, self.strict)
+        print(f"\nWatching {rel(PLUGINS_DIR)}/ and {rel(MARKETPLACE_JSON)} (Ctrl-C to stop)")
+        sys.stdout.flush()
+        try:
+            while True:
+                time.sleep(self.interval)
+                start = time.perf_counter()
+                touched = self.refresh()
+                if not touched:
+                    continue
+                after = self.findings()
+                self.report(current, after, touched, time.perf_counter() - start)
+                current = after
+        except KeyboardInterrupt:
+            print()
+
+
+# JSON-RPC 2.0 error codes.
+RPC_PARSE_ERROR = -32700
+RPC_INVALID_REQUEST = -32600
+RPC_METHOD_NOT_FOUND = -32601
+RPC_INVALID_PARAMS = -32602
+RPC_INTERNAL_ERROR = -32603
+
+
+class RpcError(Exception):
+    def __init__(self, code, message):
+        super().__init__(message)
+        self.code = code
+
+
+class Server:
+    """Line-delimited JSON-RPC 2.0 over stdin/stdout or a Unix socket.
+
+    One request or response object per line. A resident Watcher keeps the
+    marketplace, file index and per-file findings warm, so a request only
+    revalidates files whose size or mtime moved since the previous one.
+
+    Methods:
+      validateFile   {"path": P, "text": T?}  One markdown file under plugins/;
+                                              with "text", check that unsaved buffer
+      validatePlugin {"name": N}              plugin.json and file findings for N
+      validateAll    {}                       Everything, plus the run summary
+      shutdown       {}                       Stop serving after replying
+    """
+
+    def __init__(self, strict=False):
+        self.strict = strict
+        self.watcher = Watcher(strict=strict)
+        self.running = True
+        self.stats = {}
+        self.stats_index = None
+        self.methods = {
+            "validateFile": self.validate_file,
+            "validatePlugin": self.validate_plugin,
+            "validateAll": self.validate_all,
+            "shutdown": self.shutdown,
+        }
+
+    def handle_line(self, line):
+        """Answer one request line; returns the response line, or None for notifications."""
+        try:
+            request = json.loads(line)
+        except json.JSONDecodeError as exc:
+            return self.error(None, RPC_PARSE_ERROR, f"Parse error: {exc}")
+        if not isinstance(request, dict) or request.get("jsonrpc") != "2.0" \
+                or not isinstance(request.get("method"), str):
+            return self.error(None, RPC_INVALID_REQUEST, "Invalid request")
+        request_id = request.get("id")
+        method = self.methods.get(request["method"])
+        params = request.get("params", {})
+        try:
+            if method is None:
+                raise RpcError(RPC_METHOD_NOT_FOUND, f"Method not found: {request['method']}")
+            if not isinstance(params, dict):
+                raise RpcError(RPC_INVALID_PARAMS, "params must be an object")
+            result = method(params)
+        except RpcError as exc:
+            return self.error(request_id, exc.code, str(exc)) if "id" in request else None
+        except Exception as exc:  # keep serving; report the failure to the client
+            return self.error(request_id, RPC_INTERNAL_ERROR, f"{type(exc).__name__}: {exc}") \
+                if "id" in request else None
+        if "id" not in request:
+            return None
+        return json.dumps({"jsonrpc": "2.0", "id": request_id, "result": result})
+
+    @staticmethod
+    def error(request_id, code, message):
+        return json.dumps({"jsonrpc": "2.0", "id": request_id,
+                           "error": {"code": code, "message": message}})
+
+    @staticmethod
+    def param(params, key):
+        value = params.get(key)
+        if not isinstance(value, str) or not value:
+            raise RpcError(RPC_INVALID_PARAMS, f"{key!r} must be a non-empty string")
+        return value
+
+    def validate_file(self, params):
+        path = Path(self.param(params, "path"))
+        path = Path(os.path.abspath(path if path.is_absolute() else REPO_ROOT / path))
+        try:
+            parts = path.relative_to(PLUGINS_DIR).parts
+        except ValueError:
+            parts = ()
+        kind = file_kind(parts[1:])
+        if kind is None:
+            raise RpcError(RPC_INVALID_PARAMS, f"Not a markdown file under {rel(PLUGINS_DIR)}/: {rel(path)}")
+        plugin = parts[0]
+        text = params.get("text")
+        if text is not None:
+            if not isinstance(text, str):
+                raise RpcError(RPC_INVALID_PARAMS, "'text' must be a string")
+            findings = []
+            if oversized(len(text.encode("utf-8"))):
+                add(findings, "warning", "File too large", path,
+                    f"Skipped: exceeds --max-file-size {format_size(MAX_FILE_BYTES)}", plugin)
+            else:
+                FILE_VALIDATORS[kind](path, plugin, findings, decode_text(text.encode("utf-8")))
+        else:
+            if not self.unchanged(path):
+                self.watcher.refresh()
+            findings = self.watcher.file_findings.get(rel(path))
+            if findings is None:
+                # Not resident: the plugin is unregistered or its plugin.json failed.
+                if not path.is_file():
+                    raise RpcError(RPC_INVALID_PARAMS, f"No such file: {rel(path)}")
+                findings = []
+                validate_file(kind, path, plugin, findings)
+        return {"path": rel(path), "plugin": plugin, "findings": [f.to_dict() for f in findings]}
+
+    def unchanged(self, path):
+        # Per-save fast path: if this file and marketplace.json match the last
+        # refresh, the resident findings stand without rescanning the tree.
+        if self.watcher.index is None or self.watcher.stat_marketplace() != self.watcher.marketplace_stat:
+            return False
+        try:
+            st = path.stat()
+        except OSError:
+            return False
+        if self.stats_index is not self.watcher.index:
+            self.stats_index = self.watcher.index
+            self.stats = {f.relpath: f.stat for f in self.stats_index.files}
+        return self.stats.get(rel(path)) == (st.st_size, st.st_mtime_ns)
+
+    def validate_plugin(self, params):
+        name = self.param(params, "name")
+        self.watcher.refresh()
+        entry = next((e for e in self.watcher.selected if e.get("name") == name), None)
+        if entry is None:
+            raise RpcError(RPC_INVALID_PARAMS, f"Plugin not in {rel(MARKETPLACE_JSON)}: {name}")
+        findings = list(self.watcher.manifest_findings.get(name, ()))
+        if name in self.watcher.checked_plugins:
+            for f in self.watcher.index.plugin_files(name):
+                findings.extend(self.watcher.file_findings.get(f.relpath, ()))
+        return {"plugin": name, "findings": [f.to_dict() for f in findings],
+                "summary": summarize(findings, [entry], self.strict)}
+
+    def validate_all(self, params):
+        self.watcher.refresh()
+        findings = self.watcher.findings()
+        return {"findings": [f.to_dict() for f in findings],
+                "summary": summarize(findings, self.watcher.selected, self.strict)}
+
+    def shutdown(self, params):
+        self.running = False
+        return None
+
+    def serve_stdio(self, infile=None, outfile=None):
+        infile = infile or sys.stdin
+        outfile = outfile or sys.stdout
+        self.watcher.refresh()  # warm everything before the first request
+        for line in infile:
+            if not line.strip():
+                continue
+            response = self.handle_line(line)
+            if response is not None:
+                outfile.write(response + "\n")
+                outfile.flush()
+            if not self.running:
+                break
+
+    def serve_socket(self, path):
+        import socketserver
+        import threading
+
+        server = self
+        lock = threading.Lock()  # the Watcher is not thread-safe; requests run one at a time
+
+        class Handler(socketserver.StreamRequestHandler):
+            def handle(self):
+                for line in self.rfile:
+                    if not line.strip():
+                        continue
+                    with lock:
+                        response = server.handle_line(line.decode("utf-8", "replace"))
+                    if response is not None:
+                        self.wfile.write((response + "\n").encode("utf-8"))
+                        self.wfile.flush()
+                    if not server.running:
+                        threading.Thread(target=self.server.shutdown, daemon=True).start()
+                        return
+
+        if os.path.exists(path):
+            os.unlink(path)  # a stale socket from a previous run
+        self.watcher.refresh()
+        with socketserver.ThreadingUnixStreamServer(path, Handler) as unix_server:
+            unix_server.daemon_threads = True
+            try:
+                unix_server.serve_forever()
+            except KeyboardInterrupt:
+                pass
+            finally:
+                os.unlink(path)
+
+
 def main():
     parser = argparse.ArgumentParser(description="Validate Claude Code marketplace plugins")
-    parser.add_argument("--json", action="store_true", help="Output validation results as JSON")
+    parser.add_argument("--json", action="store_true", help="Output validation results as JSON (same as --format json)")
+    parser.add_argument("--format", choices=sorted(WRITERS), default=None,
+                        help="Output format: human table (default), json, streaming ndjson, or sarif")
     parser.add_argument("--strict", action="store_true", help="Treat warnings as failures")
     parser.add_argument("--plugin", help="Validate a single plugin by name")
+    parser.add_argument("--jobs", "-j", type=int, default=1, metavar="N",
+                        help="Validate plugins in N worker processes (0 = one per CPU; default: 1)")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Ignore and do not update the per-file findings cache")
+    parser.add_argument("--changed-since", metavar="REF",
+                        help="Only scan files changed since git REF (plugin.json checks still run for all plugins)")
+    parser.add_argument("--watch", action="store_true",
+                        help="Keep running and revalidate changed files under plugins/ on every save")
+    parser.add_argument("--serve", action="store_true",
+                        help="Serve line-delimited JSON-RPC (validateFile, validatePlugin, validateAll)")
+    parser.add_argument("--socket", metavar="PATH",
+                        help="With --serve, listen on a Unix socket instead of stdin/stdout")
+    parser.add_argument("--interval", type=float, default=0.5, metavar="SECONDS",
+                        help="Polling interval for --watch (default: 0.5)")
+    parser.add_argument("--profile", action="store_true",
+                        help="Print per-check and per-plugin timings to stderr")
+    parser.add_argument("--profile-top", type=int, default=10, metavar="N",
+                        help="Rows in the --profile slowest plugin/file tables (default: 10)")
+    parser.add_argument("--profile-json", metavar="PATH",
+                        help="With --profile, also write the timing report as JSON")
+    parser.add_argument("--cprofile", metavar="PATH",
+                        help="Write a cProfile dump of the run (inspect with python -m pstats)")
+    parser.add_argument("--rules", metavar="IDS",
+                        help="Comma-separated rule ids to run (default: all; see --list-rules)")
+    parser.add_argument("--skip-rules", metavar="IDS",
+                        help="Comma-separated rule ids to skip")
+    parser.add_argument("--fast", action="store_true",
+                        help="Run only cheap structural rules (for pre-commit hooks)")
+    parser.add_argument("--list-rules", action="store_true",
+                        help="List registered rules and exit")
+    parser.add_argument("--max-file-size", type=parse_size, default="0", metavar="SIZE",
+                        help="Report markdown files larger than SIZE (e.g. 512K, 4M) instead of "
+                             "reading them (default: 0, no limit)")
     args = parser.parse_args()
-
-    findings, selected = run_validation(args.plugin)
-    if args.json:
-        print_json(findings, selected, args.strict)
-    else:
-        print_human(findings, selected, args.strict)
+    if args.jobs < 0:
+        parser.error("--jobs must be >= 0")
+    if args.list_rules:
+        print(f"{'RULE':<20} {'COST':<10} {'APPLIES TO':<24} DESCRIPTION")
+        print("-" * 100)
+        for r in RULES.values():
+            print(f"{r.rule_id:<20} {r.cost:<10} {', '.join(r.kinds):<24} {r.description}")
+        sys.exit(0)
+    global ACTIVE_RULES, MAX_FILE_BYTES
+    MAX_FILE_BYTES = args.max_file_size
+    if args.rules or args.skip_rules or args.fast:
+        try:
+            ACTIVE_RULES = select_rules(split_list(args.rules), split_list(args.skip_rules), args.fast)
+        except ValueError as exc:
+            parser.error(str(exc))
+    if args.profile_json and not args.profile:
+        parser.error("--profile-json requires --profile")
+    if args.socket and not args.serve:
+        parser.error("--socket requires --serve")
+    if args.serve:
+        if args.watch or args.plugin or args.changed_since or args.json or args.format:
+            parser.error("--serve answers per-request; drop --watch/--plugin/--changed-since/--json/--format")
+        server = Server(args.strict)
+        if args.socket:
+            import socket
+            if not hasattr(socket, "AF_UNIX"):
+                parser.error("--socket needs Unix domain sockets, which this platform lacks")
+            server.serve_socket(args.socket)
+        else:
+            server.serve_stdio()
+        sys.exit(0)
+    if args.watch:
+        if args.changed_since or args.json or args.format not in (None, "human"):
+            parser.error("--watch only supports the human output format over the full tree")
+        Watcher(args.plugin, args.strict, args.interval).run()
+        sys.exit(0)
+
+    if args.json and args.format not in (None, "json"):
+        parser.error("--json conflicts with --format " + args.format)
+    writer = WRITERS[args.format or ("json" if args.json else "human")](args.strict)
+
+    global PROFILER
+    if args.profile:
+        PROFILER = Profiler()
+    profile = None
+    if args.cprofile:
+        import cProfile
+        profile = cProfile.Profile()
+        profile.enable()
+    try:
+        findings, selected = run_validation(args.plugin, args.jobs, not args.no_cache,
+                                            args.changed_since, writer)
+    except ChangedSinceError as exc:
+        parser.error(f"--changed-since: {exc}")
+    finally:
+        if profile is not None:
+            profile.disable()
+            profile.dump_stats(args.cprofile)
+    if PROFILER is not None:
+        PROFILER.stop()
+    writer.close(selected)
+    if PROFILER is not None:
+        PROFILER.print_report(args.profile_top)
+        if args.profile_json:
+            with open(args.profile_json, "w", encoding="utf-8") as f:
+                json.dump(PROFILER.to_dict(args.profile_top), f, indent=2)
+                f.write("\n")
 
     errors = any(f.severity == "error" for f in findings)
     warnings = any(f.severity == "warning" for f in findings)
@@ -8,13 +8,17 @@
 # Options:
 #   -h, --help              Show this help message
 #   -v, --validate          Validate all versions match (default action)
-#   -b, --bump TYPE         Bump version (TYPE: patch, minor, major)
+#   -b, --bump TYPE         Bump version (TYPE: patch, minor, major, prerelease)
 #   -i, --increment TYPE    Same as --bump
+#   --preid ID              Pre-release identifier for --bump prerelease (e.g. rc)
 #   -p, --plugin NAME       Specify plugin to bump (required with --bump)
 #   -a, --all               Apply bump to all plugins
 #   -d, --dry-run           Show what would change without making changes
 #   -q, --quiet             Only output errors and mismatches
 #   --json                  Output validation results as JSON
+#   --index                 Rebuild the keyword search index
+#   --search TERM...        Ranked plugin search by keyword, name and description
+#   --history               Version timeline per plugin from git (--since REF to filter)
 #
 # Examples:
 #   ./version-tracker.sh                    # Validate all versions
@@ -22,6 +26,9 @@
 #   ./version-tracker.sh -b patch -p bash-master    # Bump bash-master patch version
 #   ./version-tracker.sh --bump minor --all         # Bump all plugins minor version
 #   ./version-tracker.sh -b major -p ffmpeg-master --dry-run
+#   ./version-tracker.sh -b prerelease --preid rc -p bash-master   # 1.2.3 -> 1.2.4-rc.0
+#   ./version-tracker.sh --search docker compose    # Find plugins by keyword
+#   ./version-tracker.sh --history --since v2.0.0   # Version changes since a tag
 #
 
 set -euo pipefail
@@ -30,7 +37,7 @@ SCRIPT_DIR=$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)
 
 # Show help if requested
 if [[ "${1:-}" == "-h" || "${1:-}" == "--help" ]]; then
-    head -25 "${BASH_SOURCE[0]}" | tail -24 | sed 's/^# \?//'
+    head -32 "${BASH_SOURCE[0]}" | tail -31 | sed 's/^# \?//'
     exit 0
 fi
 
@@ -1,17 +1,37 @@
 #!/usr/bin/env python3
 """
 version_ops.py - Version and keyword tracking operations for Claude plugins
+
+Usage:
+  python scripts/version_ops.py --validate --metadata all
+  python scripts/version_ops.py --sync --metadata keywords --dry-run
+  python scripts/version_ops.py -b patch -p PLUGIN
+  python scripts/version_ops.py -b minor --plugins a,b,c    # One all-or-nothing batch
+  python scripts/version_ops.py --index                     # Rebuild the keyword search index
+  python scripts/version_ops.py --search docker compose     # Ranked plugin search
+  python scripts/version_ops.py --history                   # Version timeline per plugin (from git)
+  python scripts/version_ops.py --history --since v2.0.0    # Version changes since a tag or commit
 """
 
 import argparse
+import functools
 import json
+import math
+import os
+import re
 import sys
+import time
+from bisect import bisect_left
+from collections import Counter
 from pathlib import Path
 
 SCRIPT_DIR = Path(__file__).parent
 REPO_ROOT = SCRIPT_DIR.parent
 MARKETPLACE_JSON = REPO_ROOT / '.claude-plugin' / 'marketplace.json'
 PLUGINS_DIR = REPO_ROOT / 'plugins'
+LOAD_WORKERS = 1  # --jobs: threads for reading plugin.json files
+INDEX_FILE = REPO_ROOT / '.cache' / 'version_ops_index.json'
+INDEX_VERSION = 1
 
 
 class Colors:
@@ -43,19 +63,21 @@ def log_error(msg):
     print(f"{Colors.RED}[ERROR]{Colors.NC} {msg}", file=sys.stderr)
 
 
+def plugin_json_path(plugin_name):
+    return PLUGINS_DIR / plugin_name / '.claude-plugin' / 'plugin.json'
+
+
 def load_marketplace():
     with open(MARKETPLACE_JSON, 'r', encoding='utf-8') as f:
         return json.load(f)
 
 
 def save_marketplace(data):
-    with open(MARKETPLACE_JSON, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
-        f.write(chr(10))
+    write_json_files([(MARKETPLACE_JSON, data)])
 
 
 def load_plugin_json(plugin_name):
-    plugin_json = PLUGINS_DIR / plugin_name / '.claude-plugin' / 'plugin.json'
+    plugin_json = plugin_json_path(plugin_name)
     if not plugin_json.exists():
         return None
     with open(plugin_json, 'r', encoding='utf-8') as f:
@@ -63,42 +85,237 @@ def load_plugin_json(plugin_name):
 
 
 def save_plugin_json(plugin_name, data):
-    plugin_json = PLUGINS_DIR / plugin_name / '.claude-plugin' / 'plugin.json'
-    with open(plugin_json, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
-        f.write(chr(10))
+    write_json_files([(plugin_json_path(plugin_name), data)])
+
+
+def write_json_files(documents, compact=False):
+    """Write (path, data) pairs all-or-nothing: temp files first, then renames.
+
+    Every document is serialised and flushed to a temp file beside its target
+    before any target is touched, so a serialisation or disk error leaves all
+    files as they were. The renames that follow are each atomic.
+    """
+    staged = []
+    try:
+        for path, data in documents:
+            tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+            staged.append((tmp, path))
+            with open(tmp, 'w', encoding='utf-8') as f:
+                if compact:
+                    json.dump(data, f, separators=(',', ':'), ensure_ascii=False)
+                else:
+                    json.dump(data, f, indent=2, ensure_ascii=False)
+                f.write('\n')
+                f.flush()
+                os.fsync(f.fileno())
+    except BaseException:
+        for tmp, _ in staged:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+        raise
+    for tmp, path in staged:
+        os.replace(tmp, path)
+
+
+class MetadataRepository:
+    """Snapshot of marketplace.json and every plugin.json, each read at most once.
+
+    plugin_json() loads lazily; load_all() reads every registered plugin.json
+    up front, optionally on a thread pool (--jobs). All validate, sync and bump
+    commands in a process share one snapshot, so no file is read twice.
+    """
+
+    def __init__(self):
+        self.marketplace = load_marketplace()
+        # Entries without a name cannot be compared or edited; schema_errors()
+        # reports them, so they are left out here rather than crashing.
+        plugins = self.marketplace.get('plugins')
+        self.listed = [p for p in plugins if isinstance(p, dict) and isinstance(p.get('name'), str)] \
+            if isinstance(plugins, list) else []
+        self.entries = {p['name']: p for p in self.listed}
+        self.plugin_data = {}
+
+    def plugin_json(self, name):
+        if name not in self.plugin_data:
+            self.plugin_data[name] = load_plugin_json(name)
+        return self.plugin_data[name]
+
+    def schema_errors(self, names=None):
+        """(document, SchemaError) pairs for marketplace.json and each loaded plugin.json.
+
+        Checked against scripts/schemas/; see manifest_schema.py. With `names`,
+        marketplace violations under another plugin's /plugins/<i> entry and
+        other plugins' plugin.json files are left out.
+        """
+        from manifest_schema import load_validator
+
+        problems = [('.claude-plugin/marketplace.json', e)
+                    for e in load_validator('marketplace')(self.marketplace)]
+        if names is not None:
+            plugins = self.marketplace.get('plugins')
+            keep = {str(i) for i, p in enumerate(plugins)
+                    if isinstance(p, dict) and p.get('name') in names} if isinstance(plugins, list) else set()
+            problems = [(document, e) for document, e in problems
+                        if not e.pointer.startswith('/plugins/') or e.pointer.split('/')[2] in keep]
+        validate_plugin = load_validator('plugin')
+        for name, data in self.plugin_data.items():
+            if data is not None and (names is None or name in names):
+                document = f'plugins/{name}/.claude-plugin/plugin.json'
+                problems.extend((document, e) for e in validate_plugin(data))
+        return problems
+
+    def select(self, names=None):
+        """Marketplace entries for `names` (all when None); raises KeyError on unknown names."""
+        if names is None:
+            return list(self.listed)
+        unknown = [n for n in names if n not in self.entries]
+        if unknown:
+            raise KeyError(', '.join(unknown))
+        return [self.entries[n] for n in names]
+
+    def load_all(self, names=None, workers=None):
+        """Read the plugin.json of every plugin in `names` (default: all registered)."""
+        names = [n for n in (self.entries if names is None else names) if n not in self.plugin_data]
+        workers = LOAD_WORKERS if workers is None else workers
+        if workers <= 1 or len(names) < 2:
+            for name in names:
+                self.plugin_json(name)
+            return self
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=min(workers, len(names))) as pool:
+            # File reads release the GIL, so threads overlap I/O waits. On a warm
+            # local disk the pool costs more than it saves; it pays off on
+            # network filesystems and cold caches.
+            for name, data in zip(names, pool.map(load_plugin_json, names)):
+                self.plugin_data[name] = data
+        return self
+
+
+class Transaction(MetadataRepository):
+    """A MetadataRepository whose edits are staged and written in one batch.
+
+    Edits are made to the loaded dicts and the touched files are marked dirty.
+    commit() writes every dirty file via write_json_files(), so a batch either
+    lands completely or not at all.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.dirty_marketplace = False
+        self.dirty_plugins = set()
+
+    def set_marketplace(self, name, key, value):
+        self.entries[name][key] = value
+        self.dirty_marketplace = True
+
+    def set_plugin(self, name, key, value):
+        self.plugin_json(name)[key] = value
+        self.dirty_plugins.add(name)
+
+    def pending(self):
+        documents = [(plugin_json_path(n), self.plugin_data[n]) for n in sorted(self.dirty_plugins)]
+        if self.dirty_marketplace:
+            documents.append((MARKETPLACE_JSON, self.marketplace))
+        return documents
+
+    def commit(self):
+        """Write all dirty files; returns how many were written."""
+        documents = self.pending()
+        write_json_files(documents)
+        self.dirty_marketplace = False
+        self.dirty_plugins = set()
+        return len(documents)
+
+
+def duplicates(keywords):
+    """Keywords that occur more than once, in first-occurrence order."""
+    return [kw for kw, count in Counter(keywords).items() if count > 1]
 
 
 def keyword_delta(marketplace_keywords, plugin_keywords):
-    """Return keyword differences while preserving display order from each source."""
+    """Return keyword differences while preserving display order from each source.
+
+    Linear in the keyword count: membership uses dicts, which also act as
+    ordered sets. `reordered` compares the relative order of the keywords the
+    two lists share, ignoring missing/extra ones and repeat occurrences.
+    `order_or_duplicate_mismatch` keeps its original meaning (same set and
+    length, different list) for existing --json consumers.
+    """
     mp = marketplace_keywords or []
     pj = plugin_keywords or []
+    mp_set = dict.fromkeys(mp)
+    pj_set = dict.fromkeys(pj)
     return {
-        'missing_from_marketplace': [kw for kw in pj if kw not in mp],
-        'extra_in_marketplace': [kw for kw in mp if kw not in pj],
-        'order_or_duplicate_mismatch': mp != pj and set(mp) == set(pj) and len(mp) == len(pj),
+        'missing_from_marketplace': [kw for kw in pj_set if kw not in mp_set],
+        'extra_in_marketplace': [kw for kw in mp_set if kw not in pj_set],
+        'duplicated_in_marketplace': duplicates(mp),
+        'duplicated_in_plugin_json': duplicates(pj),
+        'reordered': [kw for kw in mp_set if kw in pj_set] != [kw for kw in pj_set if kw in mp_set],
+        'order_or_duplicate_mismatch': mp != pj and mp_set.keys() == pj_set.keys() and len(mp) == len(pj),
     }
 
 
-def validate_versions(quiet=False, json_output=False):
-    marketplace = load_marketplace()
+def manifest_field(document, key, default):
+    """document[key], or `default` when the document or field is missing or malformed."""
+    return document.get(key, default) if isinstance(document, dict) else default
+
+
+def keyword_list(document):
+    keywords = manifest_field(document, 'keywords', [])
+    return [kw for kw in keywords if isinstance(kw, str)] if isinstance(keywords, list) else []
+
+
+def schema_report(schema_errors):
+    """JSON-ready rows for (document, SchemaError) pairs from MetadataRepository.schema_errors()."""
+    return [{'document': document, 'pointer': error.pointer or '/', 'message': error.message}
+            for document, error in schema_errors]
+
+
+def print_schema_report(rows):
+    if not rows:
+        return
+    print(f"{Colors.BOLD}=== Schema Violations ==={Colors.NC}")
+    print()
+    for row in rows:
+        print(f"{row['document']} {Colors.RED}{row['pointer']}: {row['message']}{Colors.NC}")
+    print()
+
+
+def truncated(label, keywords, limit=8):
+    text = f"{label}: " + ', '.join(keywords[:limit])
+    if len(keywords) > limit:
+        text += f" (+{len(keywords) - limit} more)"
+    return text
+
+
+def validate_versions(quiet=False, json_output=False, repo=None, schema_errors=(), names=None):
+    """Compare marketplace.json and plugin.json versions.
+
+    `schema_errors` (from MetadataRepository.schema_errors()) are reported
+    alongside the comparison and fail the run. `names` limits the check to
+    those plugins (default: all).
+    """
+    repo = repo or MetadataRepository()
+    schema = schema_report(schema_errors)
 
     results = []
     match_count = 0
     mismatch_count = 0
     missing_count = 0
 
-    for plugin in marketplace['plugins']:
+    for plugin in repo.select(names):
         name = plugin['name']
-        mp_version = plugin['version']
+        mp_version = plugin.get('version', 'NOT_FOUND')
 
-        plugin_data = load_plugin_json(name)
+        plugin_data = repo.plugin_json(name)
         if plugin_data is None:
             pj_version = 'NOT_FOUND'
             status = 'MISSING'
             missing_count += 1
         else:
-            pj_version = plugin_data.get('version', 'NOT_FOUND')
+            pj_version = manifest_field(plugin_data, 'version', 'NOT_FOUND')
             if mp_version == pj_version:
                 status = 'MATCH'
                 match_count += 1
@@ -116,17 +333,20 @@ def validate_versions(quiet=False, json_output=False):
     if json_output:
         output = {
             'validation_results': results,
+            'schema_errors': schema,
             'summary': {
                 'total': len(results),
                 'matching': match_count,
                 'mismatched': mismatch_count,
-                'missing': missing_count
+                'missing': missing_count,
+                'schema_errors': len(schema)
             }
         }
         print(json.dumps(output, indent=2))
     else:
         log_info(f"Loaded {len(results)} plugins from marketplace.json")
         print()
+        print_schema_report(schema)
         print(f"{Colors.BOLD}=== Plugin Version Validation ==={Colors.NC}")
         print()
         print(f"{'PLUGIN':<35} {'MARKETPLACE':<15} {'PLUGIN.JSON':<15} {'STATUS':<10}")
@@ -143,7 +363,7 @@ def validate_versions(quiet=False, json_output=False):
             else:
                 color = Colors.YELLOW
 
-            print(f"{r['plugin']:<35} {r['marketplace_version']:<15} {r['plugin_json_version']:<15} {color}{r['status']:<10}{Colors.NC}")
+            print(f"{r['plugin']:<35} {r['marketplace_version']!s:<15} {r['plugin_json_version']!s:<15} {color}{r['status']:<10}{Colors.NC}")
 
         print()
         print(f"{Colors.BOLD}=== Summary ==={Colors.NC}")
@@ -151,40 +371,44 @@ def validate_versions(quiet=False, json_output=False):
         print(f"Matching:      {Colors.GREEN}{match_count}{Colors.NC}")
         print(f"Mismatched:    {Colors.RED}{mismatch_count}{Colors.NC}")
         print(f"Missing:       {Colors.YELLOW}{missing_count}{Colors.NC}")
+        if schema:
+            print(f"Schema errors: {Colors.RED}{len(schema)}{Colors.NC}")
         print()
 
-    if mismatch_count > 0:
+    if mismatch_count > 0 or schema:
         return 1
     elif missing_count > 0:
         return 2
     return 0
 
 
-def validate_keywords(quiet=False, json_output=False):
+def validate_keywords(quiet=False, json_output=False, repo=None, schema_errors=(), names=None):
     """Validate marketplace keywords match plugin.json keywords exactly.
 
     Source of truth: plugins/<name>/.claude-plugin/plugin.json. The central
     marketplace mirrors plugin-owned keyword metadata for discovery.
+    `schema_errors` and `names` work as in validate_versions().
     """
-    marketplace = load_marketplace()
+    repo = repo or MetadataRepository()
+    schema = schema_report(schema_errors)
 
     results = []
     match_count = 0
     mismatch_count = 0
     missing_count = 0
 
-    for plugin in marketplace['plugins']:
+    for plugin in repo.select(names):
         name = plugin['name']
-        mp_keywords = plugin.get('keywords', [])
+        mp_keywords = keyword_list(plugin)
 
-        plugin_data = load_plugin_json(name)
+        plugin_data = repo.plugin_json(name)
         if plugin_data is None:
             pj_keywords = None
             status = 'MISSING'
             missing_count += 1
-            delta = {'missing_from_marketplace': [], 'extra_in_marketplace': [], 'order_or_duplicate_mismatch': False}
+            delta = keyword_delta([], [])
         else:
-            pj_keywords = plugin_data.get('keywords', [])
+            pj_keywords = keyword_list(plugin_data)
             if mp_keywords == pj_keywords:
                 status = 'MATCH'
                 match_count += 1
@@ -204,11 +428,13 @@ def validate_keywords(quiet=False, json_output=False):
     if json_output:
         output = {
             'validation_results': results,
+            'schema_errors': schema,
             'summary': {
                 'total': len(results),
                 'matching': match_count,
                 'mismatched': mismatch_count,
                 'missing': missing_count,
+                'schema_errors': len(schema),
                 'source_of_truth': 'plugins/<name>/.claude-plugin/plugin.json keywords'
             }
         }
@@ -216,6 +442,7 @@ def validate_keywords(quiet=False, json_output=False):
     else:
         log_info(f"Loaded {len(results)} plugins from marketplace.json")
         print()
+        print_schema_report(schema)
         print(f"{Colors.BOLD}=== Plugin Keyword Validation ==={Colors.NC}")
         print("Source of truth: plugins/<name>/.claude-plugin/plugin.json")
         print()
@@ -237,15 +464,15 @@ def validate_keywords(quiet=False, json_output=False):
             if r['status'] == 'MISMATCH':
                 parts = []
                 if r['missing_from_marketplace']:
-                    parts.append('missing: ' + ', '.join(r['missing_from_marketplace'][:8]))
-                    if len(r['missing_from_marketplace']) > 8:
-                        parts[-1] += f" (+{len(r['missing_from_marketplace']) - 8} more)"
+                    parts.append(truncated('missing', r['missing_from_marketplace']))
                 if r['extra_in_marketplace']:
-                    parts.append('extra: ' + ', '.join(r['extra_in_marketplace'][:8]))
-                    if len(r['extra_in_marketplace']) > 8:
-                        parts[-1] += f" (+{len(r['extra_in_marketplace']) - 8} more)"
-                if r['order_or_duplicate_mismatch']:
-                    parts.append('same set, different order/duplicates')
+                    parts.append(truncated('extra', r['extra_in_marketplace']))
+                if r['duplicated_in_marketplace']:
+                    parts.append(truncated('duplicated in marketplace', r['duplicated_in_marketplace']))
+                if r['duplicated_in_plugin_json']:
+                    parts.append(truncated('duplicated in plugin.json', r['duplicated_in_plugin_json']))
+                if r['reordered']:
+                    parts.append('shared keywords in a different order')
                 details = '; '.join(parts)
 
             pj_count = 'NOT_FOUND' if r['plugin_json_keyword_count'] is None else r['plugin_json_keyword_count']
@@ -257,26 +484,31 @@ def validate_keywords(quiet=False, json_output=False):
         print(f"Matching:      {Colors.GREEN}{match_count}{Colors.NC}")
         print(f"Mismatched:    {Colors.RED}{mismatch_count}{Colors.NC}")
         print(f"Missing:       {Colors.YELLOW}{missing_count}{Colors.NC}")
+        if schema:
+            print(f"Schema errors: {Colors.RED}{len(schema)}{Colors.NC}")
         print()
 
-    if mismatch_count > 0:
+    if mismatch_count > 0 or schema:
         return 1
     elif missing_count > 0:
         return 2
     return 0
 
 
-def validate_all(quiet=False, json_output=False):
+def validate_all(quiet=False, json_output=False, repo=None, schema_errors=(), names=None):
+    repo = repo or MetadataRepository()
     if json_output:
         # Keep JSON parseable by composing the same checks without printing the table output.
-        marketplace = load_marketplace()
+        schema = schema_report(schema_errors)
         version_results = []
         keyword_results = []
         version_mismatches = version_missing = keyword_mismatches = keyword_missing = 0
 
-        for plugin in marketplace['plugins']:
+        selected = repo.select(names)
+        for plugin in selected:
             name = plugin['name']
-            plugin_data = load_plugin_json(name)
+            mp_keywords = keyword_list(plugin)
+            plugin_data = repo.plugin_json(name)
             if plugin_data is None:
                 version_status = keyword_status = 'MISSING'
                 version_missing += 1
@@ -284,12 +516,12 @@ def validate_all(quiet=False, json_output=False):
                 pj_version = 'NOT_FOUND'
                 pj_keywords = None
             else:
-                pj_version = plugin_data.get('version', 'NOT_FOUND')
-                version_status = 'MATCH' if plugin['version'] == pj_version else 'MISMATCH'
+                pj_version = manifest_field(plugin_data, 'version', 'NOT_FOUND')
+                version_status = 'MATCH' if plugin.get('version', 'NOT_FOUND') == pj_version else 'MISMATCH'
                 if version_status == 'MISMATCH':
                     version_mismatches += 1
-                pj_keywords = plugin_data.get('keywords', [])
-                keyword_status = 'MATCH' if plugin.get('keywords', []) == pj_keywords else 'MISMATCH'
+                pj_keywords = keyword_list(plugin_data)
+                keyword_status = 'MATCH' if mp_keywords == pj_keywords else 'MISMATCH'
                 if keyword_status == 'MISMATCH':
                     keyword_mismatches += 1
 
@@ -299,10 +531,10 @@ def validate_all(quiet=False, json_output=False):
                 'plugin_json_version': pj_version,
                 'status': version_status,
             })
-            delta = keyword_delta(plugin.get('keywords', []), pj_keywords or [])
+            delta = keyword_delta(mp_keywords, pj_keywords or [])
             keyword_results.append({
                 'plugin': name,
-                'marketplace_keyword_count': len(plugin.get('keywords', [])),
+                'marketplace_keyword_count': len(mp_keywords),
                 'plugin_json_keyword_count': None if pj_keywords is None else len(pj_keywords),
                 'status': keyword_status,
                 **delta,
@@ -311,31 +543,150 @@ def validate_all(quiet=False, json_output=False):
         print(json.dumps({
             'version_validation_results': version_results,
             'keyword_validation_results': keyword_results,
+            'schema_errors': schema,
             'summary': {
-                'total': len(marketplace['plugins']),
+                'total': len(selected),
                 'version_mismatched': version_mismatches,
                 'version_missing': version_missing,
                 'keyword_mismatched': keyword_mismatches,
                 'keyword_missing': keyword_missing,
+                'schema_errors': len(schema),
             }
         }, indent=2))
-        if version_mismatches or keyword_mismatches:
+        if version_mismatches or keyword_mismatches or schema:
             return 1
         if version_missing or keyword_missing:
             return 2
         return 0
 
-    version_result = validate_versions(quiet, False)
-    keyword_result = validate_keywords(quiet, False)
+    # The schema section is printed once, with the version table.
+    version_result = validate_versions(quiet, False, repo, schema_errors, names)
+    keyword_result = validate_keywords(quiet, False, repo, names=names)
     return max(version_result, keyword_result)
 
 
+@functools.lru_cache(maxsize=None)
+def semver_re():
+    """Compiled `version` pattern from scripts/schemas/, so the parser accepts exactly what the schema does."""
+    from manifest_schema import compile_pattern, load_schema
+    return compile_pattern(load_schema('plugin')['definitions']['version']['pattern'])
+
+
+class SemVer:
+    """A SemVer 2.0 version, ordered by the spec's precedence rules.
+
+    Pre-release identifiers compare numerically when numeric, lexically
+    otherwise, numeric before alphanumeric, and a release outranks its
+    pre-releases. Build metadata is kept for display but ignored for
+    ordering and equality.
+    """
+
+    __slots__ = ('major', 'minor', 'patch', 'prerelease', 'build', 'key')
+
+    def __init__(self, major, minor=0, patch=0, prerelease=(), build=()):
+        self.major = major
+        self.minor = minor
+        self.patch = patch
+        self.prerelease = tuple(prerelease)
+        self.build = tuple(build)
+        # Precedence key: a release sorts after every pre-release of the same
+        # version; identifiers sort as (0, int) for numbers, (1, str) otherwise.
+        if self.prerelease:
+            pre = (0,) + tuple((0, p, '') if isinstance(p, int) else (1, 0, p) for p in self.prerelease)
+        else:
+            pre = (1,)
+        self.key = (major, minor, patch, pre)
+
+    @classmethod
+    def parse(cls, text):
+        return parse_version(text)
+
+    def __str__(self):
+        text = f"{self.major}.{self.minor}.{self.patch}"
+        if self.prerelease:
+            text += '-' + '.'.join(str(p) for p in self.prerelease)
+        if self.build:
+            text += '+' + '.'.join(self.build)
+        return text
+
+    def __repr__(self):
+        return f"SemVer('{self}')"
+
+    def __eq__(self, other):
+        return isinstance(other, SemVer) and self.key == other.key
+
+    def __lt__(self, other):
+        return self.key < other.key
+
+    def __le__(self, other):
+        return self.key <= other.key
+
+    def __gt__(self, other):
+        return self.key > other.key
+
+    def __ge__(self, other):
+        return self.key >= other.key
+
+    def __hash__(self):
+        return hash(self.key)
+
+    def bump(self, bump_type, preid=None):
+        """Return the next version; mirrors `npm version` for pre-releases.
+
+        major/minor/patch on a pre-release finalise it when it already sits
+        at that level (1.3.0-rc.2 --minor--> 1.3.0). prerelease increments
+        the last numeric identifier (rc.1 -> rc.2), starts PREID.0 when the
+        identifier changes, and on a release bumps patch first (1.2.3 -> 1.2.4-rc.0).
+        """
+        major, minor, patch, pre = self.major, self.minor, self.patch, self.prerelease
+        if bump_type == 'major':
+            if not (pre and minor == 0 and patch == 0):
+                major += 1
+            return SemVer(major, 0, 0)
+        if bump_type == 'minor':
+            if not (pre and patch == 0):
+                minor += 1
+            return SemVer(major, minor, 0)
+        if bump_type == 'patch':
+            if not pre:
+                patch += 1
+            return SemVer(major, minor, patch)
+        if bump_type != 'prerelease':
+            raise ValueError(f"unknown bump type: {bump_type}")
+        base = (preid,) if preid else ()
+        if not pre:
+            return SemVer(major, minor, patch + 1, base + (0,))
+        if preid and pre[0] != preid:
+            return SemVer(major, minor, patch, base + (0,))
+        pre = list(pre)
+        for i in range(len(pre) - 1, -1, -1):
+            if isinstance(pre[i], int):
+                pre[i] += 1
+                break
+        else:
+            pre.append(0)
+        return SemVer(major, minor, patch, pre)
+
+
 def parse_version(version):
-    """Parse version string into tuple for comparison."""
-    if version.startswith('v'):
-        version = version[1:]
-    parts = version.split('.')
-    return tuple(int(p) for p in parts[:3]) if parts else (0, 0, 0)
+    """Parse a MAJOR.MINOR.PATCH[-PRE][+BUILD] string into a SemVer; raises ValueError when it is not one."""
+    if not isinstance(version, str):
+        raise ValueError(f"not a semantic version: {version!r}")
+    return _parse_version(version.strip())
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_version(text):
+    # Memoised: release tooling sorts the same historical versions over and
+    # over. The pattern has already rejected anything the split below could
+    # misread (leading zeros, empty identifiers, a fourth component).
+    if not semver_re().match(text):
+        raise ValueError(f"not a semantic version: {text!r}")
+    core, _, build = text.partition('+')
+    core, _, pre = core.partition('-')
+    major, minor, patch = (int(part) for part in core.split('.'))
+    prerelease = tuple(int(p) if p.isdigit() else p for p in pre.split('.')) if pre else ()
+    return SemVer(major, minor, patch, prerelease, tuple(build.split('.')) if build else ())
 
 
 def compare_versions(v1, v2):
@@ -348,21 +699,52 @@ def compare_versions(v1, v2):
     return 0
 
 
-def sync_versions(dry_run=False):
-    """Sync versions between marketplace.json and plugin.json files, using highest version."""
-    marketplace = load_marketplace()
+def start_batch(txn, names):
+    """Return (txn, entries) for a batch, or (None, None) after logging unknown names."""
+    txn = txn or Transaction()
+    try:
+        entries = txn.select(names)
+    except KeyError as exc:
+        log_error(f"Plugin not found in marketplace: {exc.args[0]}")
+        return None, None
+    if len(entries) > 1:
+        txn.load_all([e['name'] for e in entries])
+    return txn, entries
+
+
+def finish_batch(txn):
+    """Commit a batch; returns an exit code."""
+    try:
+        txn.commit()
+    except OSError as exc:
+        log_error(f"Write failed: {exc}")
+        return 1
+    return 0
+
+
+def sync_versions(dry_run=False, names=None, txn=None):
+    """Sync versions between marketplace.json and plugin.json files, using highest version.
+
+    All changes are staged in `txn` and written together; pass a Transaction
+    to combine this with other edits in one commit.
+    """
+    own = txn is None
+    txn, plugins = start_batch(txn, names)
+    if txn is None:
+        return 1
 
     print(f"{Colors.BOLD}=== Version Sync ==={Colors.NC}")
     print(f"{'PLUGIN':<35} {'MARKETPLACE':<12} {'PLUGIN.JSON':<12} {'ACTION':<30}")
     print('-' * 95)
 
     synced_count = 0
+    invalid_count = 0
 
-    for plugin in marketplace['plugins']:
+    for plugin in plugins:
         name = plugin['name']
         mp_version = plugin['version']
 
-        plugin_data = load_plugin_json(name)
+        plugin_data = txn.plugin_json(name)
         if plugin_data is None:
             print(f"{name:<35} {mp_version:<12} {'NOT_FOUND':<12} {Colors.YELLOW}skipped (no plugin.json){Colors.NC}")
             continue
@@ -373,7 +755,14 @@ def sync_versions(dry_run=False):
             continue  # Already in sync
 
         # Use the higher version
-        if compare_versions(mp_version, pj_version) > 0:
+        try:
+            newer = compare_versions(mp_version, pj_version)
+        except ValueError as exc:
+            print(f"{name:<35} {mp_version:<12} {pj_version:<12} {Colors.RED}skipped (invalid version){Colors.NC}")
+            log_error(f"{name}: {exc}")
+            invalid_count += 1
+            continue
+        if newer > 0:
             highest = mp_version
             action = f"plugin.json -> {highest}"
         else:
@@ -383,28 +772,35 @@ def sync_versions(dry_run=False):
         print(f"{name:<35} {mp_version:<12} {pj_version:<12} {Colors.GREEN}{action:<30}{Colors.NC}")
 
         if not dry_run:
-            # Update both files with highest version
-            plugin['version'] = highest
-            plugin_data['version'] = highest
-            save_plugin_json(name, plugin_data)
+            # Only the side that is behind changes
+            if mp_version != highest:
+                txn.set_marketplace(name, 'version', highest)
+            if pj_version != highest:
+                txn.set_plugin(name, 'version', highest)
 
         synced_count += 1
 
-    if not dry_run and synced_count > 0:
-        save_marketplace(marketplace)
+    if own and not dry_run and finish_batch(txn):
+        return 1
 
     print()
     if dry_run:
         log_info(f"[DRY-RUN] Would sync {synced_count} plugins")
     else:
         log_success(f"Synced {synced_count} plugins")
+    if invalid_count:
+        log_error(f"{invalid_count} plugin(s) skipped: versions must be MAJOR.MINOR.PATCH")
+        return 1
 
     return 0
 
 
-def sync_keywords(dry_run=False):
+def sync_keywords(dry_run=False, names=None, txn=None):
     """Sync marketplace keywords from plugin.json keyword metadata."""
-    marketplace = load_marketplace()
+    own = txn is None
+    txn, plugins = start_batch(txn, names)
+    if txn is None:
+        return 1
 
     print(f"{Colors.BOLD}=== Keyword Sync ==={Colors.NC}")
     print("Source of truth: plugins/<name>/.claude-plugin/plugin.json")
@@ -413,11 +809,11 @@ def sync_keywords(dry_run=False):
 
     synced_count = 0
 
-    for plugin in marketplace['plugins']:
+    for plugin in plugins:
         name = plugin['name']
         mp_keywords = plugin.get('keywords', [])
 
-        plugin_data = load_plugin_json(name)
+        plugin_data = txn.plugin_json(name)
         if plugin_data is None:
             print(f"{name:<35} {len(mp_keywords):<12} {'NOT_FOUND':<12} {Colors.YELLOW}skipped (no plugin.json){Colors.NC}")
             continue
@@ -430,12 +826,12 @@ def sync_keywords(dry_run=False):
         print(f"{name:<35} {len(mp_keywords):<12} {len(pj_keywords):<12} {Colors.GREEN}{action:<30}{Colors.NC}")
 
         if not dry_run:
-            plugin['keywords'] = pj_keywords
+            txn.set_marketplace(name, 'keywords', pj_keywords)
 
         synced_count += 1
 
-    if not dry_run and synced_count > 0:
-        save_marketplace(marketplace)
+    if own and not dry_run and finish_batch(txn):
+        return 1
 
     print()
     if dry_run:
@@ -446,47 +842,30 @@ def sync_keywords(dry_run=False):
     return 0
 
 
-def increment_version(version, bump_type):
-    has_v = version.startswith('v')
-    if has_v:
-        version = version[1:]
-
-    parts = version.split('.')
-    major = int(parts[0]) if len(parts) > 0 else 0
-    minor = int(parts[1]) if len(parts) > 1 else 0
-    patch = int(parts[2]) if len(parts) > 2 else 0
-
-    if bump_type == 'major':
-        major += 1
-        minor = 0
-        patch = 0
-    elif bump_type == 'minor':
-        minor += 1
-        patch = 0
-    elif bump_type == 'patch':
-        patch += 1
-
-    new_version = f"{major}.{minor}.{patch}"
-    if has_v:
-        new_version = 'v' + new_version
-    return new_version
+def increment_version(version, bump_type, preid=None):
+    """Bump a version string (see SemVer.bump); build metadata is dropped."""
+    return str(parse_version(version).bump(bump_type, preid))
 
 
-def bump_version(plugin_name, bump_type, dry_run=False):
-    marketplace = load_marketplace()
+def bump_version(plugin_name, bump_type, dry_run=False, txn=None, preid=None):
+    """Bump one plugin in marketplace.json and its plugin.json.
 
-    plugin_entry = None
-    for p in marketplace['plugins']:
-        if p['name'] == plugin_name:
-            plugin_entry = p
-            break
-
-    if plugin_entry is None:
-        log_error(f"Plugin not found in marketplace: {plugin_name}")
+    With a caller-owned `txn` the change is only staged; bump_all() commits.
+    """
+    own = txn is None
+    txn, plugins = start_batch(txn, [plugin_name])
+    if txn is None:
         return 1
+    plugin_entry = plugins[0]
 
     current_version = plugin_entry['version']
-    new_version = increment_version(current_version, bump_type)
+    try:
+        new_version = increment_version(current_version, bump_type, preid)
+    except ValueError as exc:
+        if not own:
+            raise
+        log_error(f"Cannot bump {plugin_name}: {exc}")
+        return 1
 
     if dry_run:
         log_info(f"[DRY-RUN] Would bump {plugin_name}: {current_version} -> {new_version}")
@@ -494,42 +873,396 @@ def bump_version(plugin_name, bump_type, dry_run=False):
 
     log_info(f"Bumping {plugin_name}: {current_version} -> {new_version}")
 
-    plugin_entry['version'] = new_version
-    save_marketplace(marketplace)
-    log_success("Updated marketplace.json")
-
-    plugin_data = load_plugin_json(plugin_name)
-    if plugin_data:
-        plugin_data['version'] = new_version
-        save_plugin_json(plugin_name, plugin_data)
-        log_success(f"Updated {plugin_name}/.claude-plugin/plugin.json")
+    txn.set_marketplace(plugin_name, 'version', new_version)
+    has_plugin_json = txn.plugin_json(plugin_name) is not None
+    if has_plugin_json:
+        txn.set_plugin(plugin_name, 'version', new_version)
     else:
-        log_warn("Plugin JSON not found, only marketplace.json was updated")
+        log_warn("Plugin JSON not found, only marketplace.json will be updated")
+    if not own:
+        return 0
 
+    if finish_batch(txn):
+        return 1
+    log_success("Updated marketplace.json")
+    if has_plugin_json:
+        log_success(f"Updated {plugin_name}/.claude-plugin/plugin.json")
     print(f"{Colors.GREEN}Successfully bumped {plugin_name} to {new_version}{Colors.NC}")
     return 0
 
 
-def bump_all(bump_type, dry_run=False):
-    marketplace = load_marketplace()
+def bump_all(bump_type, dry_run=False, names=None, preid=None):
+    """Bump every plugin (or just `names`) as one all-or-nothing batch."""
+    txn, plugins = start_batch(None, names)
+    if txn is None:
+        return 1
 
-    log_info(f"Bumping {bump_type} version for all {len(marketplace['plugins'])} plugins...")
+    scope = f"all {len(plugins)}" if names is None else str(len(plugins))
+    log_info(f"Bumping {bump_type} version for {scope} plugins...")
     print()
 
-    success_count = 0
-    fail_count = 0
+    try:
+        for plugin in plugins:
+            bump_version(plugin['name'], bump_type, dry_run, txn, preid)
+    except ValueError as exc:
+        log_error(f"Cannot bump {plugin['name']} ({plugin['version']!r}): {exc}; no files were changed")
+        return 1
 
-    for plugin in marketplace['plugins']:
-        result = bump_version(plugin['name'], bump_type, dry_run)
-        if result == 0:
-            success_count += 1
-        else:
-            fail_count += 1
+    written = len(txn.pending())
+    if not dry_run:
+        if finish_batch(txn):
+            return 1
         print()
+        log_success(f"Wrote {written} files in one batch")
 
+    print()
     print(f"{Colors.BOLD}=== Bump Summary ==={Colors.NC}")
-    print(f"Successful: {Colors.GREEN}{success_count}{Colors.NC}")
-    print(f"Failed:     {Colors.RED}{fail_count}{Colors.NC}")
+    print(f"{'Would bump' if dry_run else 'Bumped'}: {Colors.GREEN}{len(plugins)}{Colors.NC}")
+    return 0
+
+
+# Field weights for the search index: an exact keyword hit outranks a word
+# that merely appears somewhere in a description.
+INDEX_WEIGHTS = {'keyword': 6, 'name': 5, 'keyword_token': 3, 'description': 1}
+STOPWORDS = frozenset(
+    'a an and are as at be by for from in into is it of on or the this to with '
+    'use uses using your you via'.split()
+)
+TOKEN_RE = re.compile(r'[a-z0-9][a-z0-9+#.-]*[a-z0-9+#]|[a-z0-9]')
+
+
+def tokenize(text):
+    return [t for t in TOKEN_RE.findall(text.lower()) if t not in STOPWORDS]
+
+
+def index_sources(plugin_names):
+    """Files whose (size, mtime_ns) decide whether the cached index is stale."""
+    sources = {}
+    for path in [MARKETPLACE_JSON] + [plugin_json_path(n) for n in plugin_names]:
+        try:
+            st = path.stat()
+            sources[path.relative_to(REPO_ROOT).as_posix()] = [st.st_size, st.st_mtime_ns]
+        except OSError:
+            sources[path.relative_to(REPO_ROOT).as_posix()] = None
+    return sources
+
+
+def build_index(repo=None):
+    """Inverted index: term -> [[plugin number, weight], ...] over names, keywords and descriptions.
+
+    Keywords are the union of plugin.json (source of truth) and the
+    marketplace mirror, so a search works even while the two are out of sync.
+    """
+    repo = repo or MetadataRepository().load_all()
+    names = sorted(repo.entries)
+    plugins = []
+    postings = {}
+    for number, name in enumerate(names):
+        entry = repo.entries[name]
+        data = repo.plugin_json(name) or {}
+        keywords = list(dict.fromkeys(list(data.get('keywords') or []) + list(entry.get('keywords') or [])))
+        description = data.get('description') or entry.get('description') or ''
+        weights = Counter()
+        for token in tokenize(name.replace('-', ' ')):
+            weights[token] = max(weights[token], INDEX_WEIGHTS['name'])
+        for keyword in keywords:
+            phrase = ' '.join(tokenize(keyword))
+            weights[phrase] += INDEX_WEIGHTS['keyword']
+            for token in tokenize(keyword):
+                if token != phrase:
+                    weights[token] += INDEX_WEIGHTS['keyword_token']
+        for token in tokenize(description):
+            weights[token] += INDEX_WEIGHTS['description']
+        weights.pop('', None)
+        for term, weight in weights.items():
+            postings.setdefault(term, []).append([number, weight])
+        plugins.append({
+            'name': name,
+            'version': entry.get('version'),
+            'description': description,
+            'keywords': keywords,
+        })
+    return {
+        'version': INDEX_VERSION,
+        'sources': index_sources(names),
+        'plugins': plugins,
+        'postings': postings,
+    }
+
+
+def load_index(rebuild=False):
+    """Return (index, rebuilt). The cache is reused while every source file's size and mtime match."""
+    if not rebuild:
+        try:
+            with open(INDEX_FILE, 'r', encoding='utf-8') as f:
+                index = json.load(f)
+            if index.get('version') == INDEX_VERSION:
+                names = [p['name'] for p in index['plugins']]
+                if index_sources(names) == index['sources']:
+                    return index, False
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+    index = build_index()
+    try:
+        INDEX_FILE.parent.mkdir(parents=True, exist_ok=True)
+        write_json_files([(INDEX_FILE, index)], compact=True)
+    except OSError as exc:
+        log_warn(f"Could not write search index cache: {exc}")
+    return index, True
+
+
+def search_index(index, query, limit=10):
+    """Rank plugins for `query`. Terms missing from the index fall back to prefix matches.
+
+    Plugins matching more query terms rank first; ties are broken by the sum of
+    field weight x inverse document frequency.
+    """
+    plugin_count = max(len(index['plugins']), 1)
+    postings = index['postings']
+    vocabulary = None
+    scores = {}
+    matched = {}
+    terms = tokenize(query)
+    phrase = ' '.join(terms)
+    if len(terms) > 1 and phrase in postings:
+        terms.append(phrase)  # a multi-word keyword typed in full
+    for term in dict.fromkeys(terms):
+        expansions = [term] if term in postings else []
+        if not expansions:
+            if vocabulary is None:
+                vocabulary = sorted(postings)
+            i = bisect_left(vocabulary, term)
+            while i < len(vocabulary) and vocabulary[i].startswith(term):
+                expansions.append(vocabulary[i])
+                i += 1
+        for expansion in expansions:
+            plist = postings[expansion]
+            idf = math.log(plugin_count / len(plist)) + 1
+            for number, weight in plist:
+                scores[number] = scores.get(number, 0) + weight * idf
+                matched.setdefault(number, set()).add(term)
+    ranked = sorted(scores, key=lambda n: (-len(matched[n]), -scores[n], index['plugins'][n]['name']))
+    results = []
+    for number in ranked[:limit]:
+        plugin = index['plugins'][number]
+        results.append({
+            'plugin': plugin['name'],
+            'version': plugin['version'],
+            'score': round(scores[number], 2),
+            'matched_terms': sorted(matched[number]),
+            'description': plugin['description'],
+        })
+    return results
+
+
+def search_command(args):
+    start = time.perf_counter()
+    index, rebuilt = load_index(rebuild=args.index)
+    if args.index:
+        stats = {
+            'plugins': len(index['plugins']),
+            'terms': len(index['postings']),
+            'postings': sum(len(p) for p in index['postings'].values()),
+            'bytes': INDEX_FILE.stat().st_size if INDEX_FILE.exists() else None,
+            'build_ms': round((time.perf_counter() - start) * 1000, 1),
+            'path': INDEX_FILE.relative_to(REPO_ROOT).as_posix(),
+        }
+        if args.json:
+            print(json.dumps(stats, indent=2))
+        else:
+            log_success(f"Indexed {stats['plugins']} plugins: {stats['terms']} terms, "
+                        f"{stats['postings']} postings, {stats['bytes']} bytes in {stats['build_ms']} ms -> {stats['path']}")
+        return 0
+
+    query = ' '.join(args.search)
+    results = search_index(index, query, args.limit)
+    elapsed_ms = round((time.perf_counter() - start) * 1000, 1)
+    if args.json:
+        print(json.dumps({'query': query, 'index_rebuilt': rebuilt, 'elapsed_ms': elapsed_ms,
+                          'results': results}, indent=2))
+        return 0 if results else 1
+    if not results:
+        log_warn(f"No plugins match: {query}")
+        return 1
+    print(f"{Colors.BOLD}=== Search: {query} ==={Colors.NC}")
+    print(f"{'#':<3} {'PLUGIN':<30} {'SCORE':>7}  MATCHED")
+    print('-' * 80)
+    for rank, r in enumerate(results, 1):
+        print(f"{rank:<3} {r['plugin']:<30} {r['score']:>7.1f}  {', '.join(r['matched_terms'])}")
+    print()
+    note = ' (index rebuilt)' if rebuilt else ''
+    log_info(f"{len(results)} result(s) in {elapsed_ms} ms{note}")
+    return 0
+
+
+HISTORY_FILE = REPO_ROOT / '.cache' / 'version_ops_history.json'
+HISTORY_VERSION = 1
+HISTORY_PATHSPEC = 'plugins/*/.claude-plugin/plugin.json'
+VERSION_LINE_RE = re.compile(r'^\+\s*"version"\s*:\s*"([^"]*)"')
+
+
+def git(*args, check=True):
+    """Run git in the repo root; returns the CompletedProcess."""
+    import subprocess
+    try:
+        result = subprocess.run(['git', *args], cwd=REPO_ROOT, capture_output=True, text=True)
+    except OSError as exc:
+        raise RuntimeError(f"cannot run git: {exc}") from exc
+    if check and result.returncode != 0:
+        raise RuntimeError(f"git {' '.join(args)} failed: {result.stderr.strip() or result.returncode}")
+    return result
+
+
+def walk_history(ledger, revision_range):
+    """Stream `git log -p` over plugin.json files oldest-first, appending version changes.
+
+    Only added `"version"` lines matter, so the diff is requested with no
+    context lines and parsed line by line as git produces it. Returns the
+    number of commits read.
+    """
+    import subprocess
+    import tempfile
+    cmd = ['git', 'log', '--reverse', '-p', '--unified=0', '--no-color', '--no-ext-diff', '--no-renames',
+           '--format=%x1e%H%x1f%ct%x1f%s', revision_range, '--', HISTORY_PATHSPEC]
+    # stderr goes to a file, not a second pipe: git blocks once an unread
+    # stderr pipe fills, while this loop blocks waiting for more stdout.
+    with tempfile.TemporaryFile() as errors:
+        proc = subprocess.Popen(cmd, cwd=REPO_ROOT, stdout=subprocess.PIPE, stderr=errors,
+                                text=True, encoding='utf-8', errors='replace')
+        with proc:
+            commits = parse_history(proc.stdout, ledger['plugins'])
+        if proc.returncode != 0:
+            errors.seek(0)
+            raise RuntimeError(f"git log failed: {errors.read().decode('utf-8', 'replace').strip()}")
+    return commits
+
+
+def parse_history(lines, plugins):
+    """Fold `git log -p` output into per-plugin timelines; returns the number of commits seen."""
+    from datetime import datetime, timezone
+    commits = 0
+    commit = None
+    plugin = None
+    for line in lines:
+        if line.startswith('\x1e'):
+            sha, timestamp, subject = line[1:].rstrip('\n').split('\x1f', 2)
+            date = datetime.fromtimestamp(int(timestamp), timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+            commit = (sha, date, subject)
+            commits += 1
+        elif line.startswith('diff --git '):
+            parts = line.rstrip('\n').rsplit(' b/', 1)[-1].split('/')
+            plugin = parts[1] if len(parts) == 4 and parts[0] == 'plugins' and parts[2:] == ['.claude-plugin', 'plugin.json'] else None
+        elif plugin is not None and commit is not None and line.startswith('+'):
+            m = VERSION_LINE_RE.match(line)
+            if m is None:
+                continue
+            timeline = plugins.setdefault(plugin, [])
+            if not timeline or timeline[-1][0] != m.group(1):
+                timeline.append([m.group(1), commit[0], commit[1], commit[2]])
+    return commits
+
+
+def load_history(rebuild=False):
+    """Return (ledger, commits walked), extending the cached ledger from its last-seen HEAD.
+
+    The ledger maps plugin -> [[version, commit, date, subject], ...] oldest
+    first. When the cached HEAD is no longer an ancestor (rebase, reset) the
+    history is walked again from scratch.
+    """
+    head = git('rev-parse', 'HEAD').stdout.strip()
+    ledger = None
+    if not rebuild:
+        try:
+            with open(HISTORY_FILE, 'r', encoding='utf-8') as f:
+                ledger = json.load(f)
+            if ledger.get('version') != HISTORY_VERSION or not isinstance(ledger.get('plugins'), dict):
+                ledger = None
+        except (OSError, ValueError, AttributeError):
+            ledger = None
+    if ledger is not None and ledger.get('head') == head:
+        return ledger, 0
+    if ledger is not None and git('merge-base', '--is-ancestor', ledger['head'], head, check=False).returncode == 0:
+        revision_range = f"{ledger['head']}..{head}"
+    else:
+        ledger = {'version': HISTORY_VERSION, 'head': None, 'plugins': {}}
+        revision_range = head
+    commits = walk_history(ledger, revision_range)
+    ledger['head'] = head
+    try:
+        HISTORY_FILE.parent.mkdir(parents=True, exist_ok=True)
+        write_json_files([(HISTORY_FILE, ledger)], compact=True)
+    except OSError as exc:
+        log_warn(f"Could not write history cache: {exc}")
+    return ledger, commits
+
+
+def changes_since(ledger, ref):
+    """Per-plugin version changes in commits reachable from HEAD but not from `ref`."""
+    commits = set(git('rev-list', f"{ref}..HEAD", '--', HISTORY_PATHSPEC).stdout.split())
+    changes = []
+    for plugin in sorted(ledger['plugins']):
+        timeline = ledger['plugins'][plugin]
+        entries = [e for e in timeline if e[1] in commits]
+        if not entries:
+            continue
+        first = timeline.index(entries[0])
+        changes.append({
+            'plugin': plugin,
+            'from': timeline[first - 1][0] if first > 0 else None,
+            'to': entries[-1][0],
+            'releases': [{'version': v, 'commit': c, 'date': d, 'subject': s} for v, c, d, s in entries],
+        })
+    return changes
+
+
+def history_command(args):
+    plugin = args.plugin or args.plugin_name
+    try:
+        ledger, walked = load_history(rebuild=args.rebuild)
+        changes = changes_since(ledger, args.since) if args.since else None
+    except RuntimeError as exc:
+        log_error(str(exc))
+        return 1
+    plugins = ledger['plugins']
+    if plugin and plugin not in plugins:
+        log_error(f"No version history for plugin: {plugin}")
+        return 1
+
+    if args.json:
+        if changes is not None:
+            output = {'since': args.since, 'changes': changes}
+        else:
+            names = [plugin] if plugin else sorted(plugins)
+            output = {name: [{'version': v, 'commit': c, 'date': d, 'subject': s} for v, c, d, s in plugins[name]]
+                      for name in names}
+        print(json.dumps({'head': ledger['head'], 'commits_walked': walked, **({'history': output}
+                          if changes is None else output)}, indent=2))
+        return 0
+
+    if changes is not None:
+        print(f"{Colors.BOLD}=== Version changes since {args.since} ==={Colors.NC}")
+        print(f"{'PLUGIN':<35} {'FROM':<14} {'TO':<14} RELEASES")
+        print('-' * 80)
+        for c in changes:
+            print(f"{c['plugin']:<35} {c['from'] or '(new)':<14} {Colors.GREEN}{c['to']:<14}{Colors.NC} {len(c['releases'])}")
+        if not changes:
+            log_info("No plugin versions changed")
+    elif plugin:
+        print(f"{Colors.BOLD}=== Version history: {plugin} ==={Colors.NC}")
+        print(f"{'DATE':<12} {'COMMIT':<10} {'VERSION':<14} SUBJECT")
+        print('-' * 80)
+        for version, commit, date, subject in plugins[plugin]:
+            print(f"{date[:10]:<12} {commit[:8]:<10} {version:<14} {subject}")
+    else:
+        print(f"{Colors.BOLD}=== Version history ==={Colors.NC}")
+        print(f"{'PLUGIN':<35} {'CURRENT':<14} {'RELEASES':>8}  LAST CHANGE")
+        print('-' * 80)
+        for name in sorted(plugins):
+            version, commit, date, _ = plugins[name][-1]
+            print(f"{name:<35} {version:<14} {len(plugins[name]):>8}  {date[:10]} {commit[:8]}")
+    print()
+    log_info(f"Ledger at {ledger['head'][:8]}; walked {walked} new commit(s)")
+    return 0
 
 
 def main():
@@ -542,53 +1275,116 @@ def main():
                         help='Sync versions using highest version, or keywords from plugin.json with --metadata keywords')
     parser.add_argument('--metadata', choices=['versions', 'keywords', 'all'], default='versions',
                         help='Metadata type for --validate/--sync (default: versions). Keyword source of truth is plugin.json')
-    parser.add_argument('-b', '--bump', choices=['patch', 'minor', 'major'],
+    parser.add_argument('-b', '--bump', choices=['patch', 'minor', 'major', 'prerelease'],
                         help='Bump version type')
-    parser.add_argument('-i', '--increment', choices=['patch', 'minor', 'major'],
+    parser.add_argument('-i', '--increment', choices=['patch', 'minor', 'major', 'prerelease'],
                         help='Same as --bump')
-    parser.add_argument('-p', '--plugin', help='Plugin name to bump')
+    parser.add_argument('--preid', metavar='ID',
+                        help='Pre-release identifier for --bump prerelease (e.g. rc -> 1.2.4-rc.0)')
+    parser.add_argument('-p', '--plugin', help='Plugin name to bump, or to limit --validate/--history to')
     parser.add_argument('-a', '--all', action='store_true',
                         help='Apply bump to all plugins')
+    parser.add_argument('--plugins', metavar='A,B,C',
+                        help='Comma-separated plugins to bump or sync as one all-or-nothing batch, or to validate')
     parser.add_argument('-d', '--dry-run', action='store_true',
                         help='Show what would change without making changes')
     parser.add_argument('-q', '--quiet', action='store_true',
                         help='Only output errors and mismatches')
     parser.add_argument('--json', action='store_true',
                         help='Output validation results as JSON')
+    parser.add_argument('-j', '--jobs', type=int, default=1, metavar='N',
+                        help='Threads for reading plugin.json files (default: 1; helps on network filesystems)')
+    lookup = parser.add_mutually_exclusive_group()
+    lookup.add_argument('--index', action='store_true',
+                        help='Rebuild the cached keyword search index')
+    lookup.add_argument('--search', nargs='+', metavar='TERM',
+                        help='Search plugins by keyword, name and description')
+    lookup.add_argument('--history', action='store_true',
+                        help='Per-plugin version timeline from git history (one plugin with -p or PLUGIN_NAME)')
+    parser.add_argument('-n', '--limit', type=int, default=10,
+                        help='Maximum --search results (default: 10)')
+    parser.add_argument('--since', metavar='REF',
+                        help='With --history: only version changes in commits after REF (e.g. a release tag)')
+    parser.add_argument('--rebuild', action='store_true',
+                        help='With --history: ignore the cached ledger and walk the full history')
     parser.add_argument('plugin_name', nargs='?',
                         help='Plugin name (positional argument)')
 
     args = parser.parse_args()
+    if args.jobs < 1:
+        parser.error('--jobs must be >= 1')
+    global LOAD_WORKERS
+    LOAD_WORKERS = args.jobs
 
     if not sys.stdout.isatty():
         Colors.disable()
 
+    if (args.since or args.rebuild) and not args.history:
+        parser.error('--since and --rebuild require --history')
+    if args.index or args.search or args.history:
+        if args.sync or args.bump or args.increment or args.validate:
+            parser.error('--index, --search and --history cannot be combined with --validate, --sync or --bump')
+        if args.history:
+            sys.exit(history_command(args))
+        sys.exit(search_command(args))
+
     bump_type = args.bump or args.increment
+    if args.preid is not None:
+        if bump_type != 'prerelease':
+            parser.error('--preid requires --bump prerelease')
+        if not re.fullmatch(r'[0-9A-Za-z-]+', args.preid) or args.preid.isdigit():
+            parser.error('--preid must be an alphanumeric identifier such as rc, beta or alpha')
+    names = None
+    if args.plugins is not None:
+        names = list(dict.fromkeys(n.strip() for n in args.plugins.split(',') if n.strip()))
+        if not names:
+            parser.error('--plugins needs at least one plugin name')
+        if args.all or args.plugin or args.plugin_name:
+            parser.error('--plugins cannot be combined with --all, -p or a positional plugin name')
 
     if args.sync:
         if args.metadata == 'versions':
-            sys.exit(sync_versions(args.dry_run))
+            sys.exit(sync_versions(args.dry_run, names))
         if args.metadata == 'keywords':
-            sys.exit(sync_keywords(args.dry_run))
-        version_result = sync_versions(args.dry_run)
-        keyword_result = sync_keywords(args.dry_run)
+            sys.exit(sync_keywords(args.dry_run, names))
+        # One transaction, so versions and keywords land together or not at all.
+        txn, _ = start_batch(None, names)
+        if txn is None:
+            sys.exit(1)
+        version_result = sync_versions(args.dry_run, names, txn)
+        keyword_result = sync_keywords(args.dry_run, names, txn)
+        if not args.dry_run and finish_batch(txn):
+            sys.exit(1)
         sys.exit(max(version_result, keyword_result))
     elif bump_type:
         target = args.plugin or args.plugin_name
-        if args.all:
-            bump_all(bump_type, args.dry_run)
+        if args.all or names:
+            sys.exit(bump_all(bump_type, args.dry_run, names, args.preid))
         elif target:
-            sys.exit(bump_version(target, bump_type, args.dry_run))
+            sys.exit(bump_version(target, bump_type, args.dry_run, preid=args.preid))
         else:
             log_error("Specify a plugin name (-p PLUGIN) or use --all to bump all plugins")
             sys.exit(1)
     else:
+        target = args.plugin or args.plugin_name
+        if names is None and target:
+            names = [target]
+        repo = MetadataRepository()
+        try:
+            repo.select(names)
+        except KeyError as exc:
+            log_error(f"Plugin not found in marketplace: {exc.args[0]}")
+            sys.exit(1)
+        repo.load_all(names)
+        # Schema violations are part of the result (and of --json), and any
+        # of them fails the run; a run limited to some plugins only sees theirs.
+        problems = repo.schema_errors(names)
         if args.metadata == 'versions':
-            result = validate_versions(args.quiet, args.json)
+            result = validate_versions(args.quiet, args.json, repo, problems, names)
         elif args.metadata == 'keywords':
-            result = validate_keywords(args.quiet, args.json)
+            result = validate_keywords(args.quiet, args.json, repo, problems, names)
         else:
-            result = validate_all(args.quiet, args.json)
+            result = validate_all(args.quiet, args.json, repo, problems, names)
 
         if result != 0:
             if not args.json: